@@ -2,7 +2,11 @@
 Streamlit UI for Google Meet Assistant
 """
 import asyncio
+import collections
+import threading
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+from streamlit_autorefresh import st_autorefresh
 from datetime import datetime
 from pathlib import Path
 import logging
@@ -13,7 +17,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.meeting_manager import MeetingAssistant
 from src.config import Config
-from src.audio_capture import VirtualAudioRouter
+from src.status import Status
+from src.audio_capture import VirtualAudioRouter, list_audio_devices
+from src.summary_view import iter_sections
 
 # Configure logging
 logging.basicConfig(
@@ -23,63 +29,60 @@ logging.basicConfig(
 # Page config
 st.set_page_config(page_title="Google Meet Assistant", page_icon="🎙️", layout="wide", initial_sidebar_state="expanded")
 
-# Custom CSS
-st.markdown(
-    """
-<style>
-    .transcript-box {
-        background-color: #f0f2f6;
-        padding: 20px;
-        border-radius: 10px;
-        max-height: 400px;
-        overflow-y: auto;
-        font-family: monospace;
-        margin-bottom: 20px;
-    }
-    .summary-card {
-        background-color: #e8f4f8;
-        padding: 15px;
-        border-radius: 10px;
-        border-left: 4px solid #1f77b4;
-        margin-bottom: 15px;
-    }
-    .status-box {
-        padding: 10px;
-        border-radius: 5px;
-        margin-bottom: 20px;
-        font-weight: bold;
-    }
-    .status-ready { background-color: #d4edda; color: #155724; }
-    .status-recording { background-color: #fff3cd; color: #856404; }
-    .status-error { background-color: #f8d7da; color: #721c24; }
-    .status-stopped { background-color: #d1ecf1; color: #0c5460; }
-</style>
-""",
-    unsafe_allow_html=True,
-)
+# Custom CSS - read once per process and injected via st.html, which skips
+# the markdown parsing st.markdown(..., unsafe_allow_html=True) does on every rerun
+@st.cache_resource
+def load_css():
+    """Load the app stylesheet"""
+    return (Path(__file__).parent / ".streamlit" / "style.css").read_text()
+
+
+st.html(f"<style>{load_css()}</style>")
+
+# CSS class for each assistant status, indexed by Status value
+STATUS_CLASSES = [
+    "status-box status-ready",  # NOT_INITIALIZED
+    "status-box status-ready",  # READY
+    "status-box status-recording",  # RECORDING
+    "status-box status-recording",  # IN_MEETING
+    "status-box status-error",  # ERROR
+    "status-box status-stopped",  # STOPPED
+    "status-box",  # INITIALIZING
+    "status-box",  # JOINING
+    "status-box",  # STOPPING
+    "status-box",  # CLOSED
+]
 
 # Initialize session state
 if "assistant" not in st.session_state:
     st.session_state.assistant = None
-if "transcripts" not in st.session_state:
-    st.session_state.transcripts = []
+if "transcript_lines" not in st.session_state:
+    st.session_state.transcript_lines = collections.deque(maxlen=50)
 if "summaries" not in st.session_state:
     st.session_state.summaries = []
 if "status" not in st.session_state:
-    st.session_state.status = {"status": "not_initialized", "details": "", "timestamp": ""}
+    st.session_state.status = {"status": Status.NOT_INITIALIZED, "details": "", "timestamp": 0.0}
 if "is_running" not in st.session_state:
     st.session_state.is_running = False
 if "initialized" not in st.session_state:
     st.session_state.initialized = False
+if "loop" not in st.session_state:
+    # One long-lived event loop per session so the assistant's background tasks
+    # (audio, transcription websocket, summary timer) survive across reruns
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    add_script_run_ctx(loop_thread)  # lets callbacks on this thread use st.session_state
+    loop_thread.start()
+    st.session_state.loop = loop
 
 
 # Callbacks
 def on_transcript(transcript_result):
     """Handle new transcript"""
     if transcript_result.get("is_final"):
-        st.session_state.transcripts.append(
-            {"text": transcript_result["text"], "timestamp": datetime.now().strftime("%H:%M:%S")}
-        )
+        # Format the display line once here rather than on every rerun
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        st.session_state.transcript_lines.append(f"[{timestamp}] {transcript_result['text']}")
 
 
 def on_summary(summary):
@@ -93,6 +96,23 @@ def on_status_change(status):
 
 
 # Helper functions
+@st.cache_resource
+def validated_config():
+    """Validate configuration once per process (errors are not cached, so they re-check on rerun)"""
+    return Config.validate()
+
+
+def run_async(coro, timeout=None):
+    """Run a coroutine on the session's background event loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, st.session_state.loop).result(timeout=timeout)
+
+
+@st.cache_data(ttl=60)
+def get_input_devices():
+    """Get (id, name) of available input devices"""
+    return [(i, d["name"]) for i, d in enumerate(list_audio_devices()) if d["max_input_channels"] > 0]
+
+
 async def initialize_assistant():
     """Initialize the meeting assistant"""
     try:
@@ -145,7 +165,7 @@ with st.sidebar:
     # Configuration status
     st.subheader("Configuration")
     try:
-        Config.validate()
+        validated_config()
         st.success("✅ Configuration valid")
     except Exception as e:
         st.error(f"❌ Configuration error:\n{e}")
@@ -155,22 +175,17 @@ with st.sidebar:
     # Audio device selection
     st.subheader("Audio Setup")
 
-    if st.button("📋 List Audio Devices"):
-        with st.spinner("Listing audio devices..."):
-            if st.session_state.assistant is None:
-                # Create temporary assistant to list devices
-                from src.audio_capture import list_audio_devices
-
-                devices = list_audio_devices()
-
-            st.info("Check the console/logs for audio device list")
-
-    audio_device_id = st.number_input(
-        "Audio Device ID (optional)", min_value=-1, value=-1, help="Leave as -1 to use system default"
+    input_devices = dict(get_input_devices())
+    audio_device_id = st.selectbox(
+        "Audio Device",
+        options=[None, *input_devices],
+        format_func=lambda i: "System default" if i is None else f"[{i}] {input_devices[i]}",
+        help="Device to capture meeting audio from",
     )
 
-    if audio_device_id == -1:
-        audio_device_id = None
+    if st.button("🔄 Rescan Audio Devices"):
+        get_input_devices.clear()
+        st.rerun()
 
     st.markdown("---")
 
@@ -192,16 +207,9 @@ with st.sidebar:
 # Main content
 # Status display
 status = st.session_state.status
-status_class = {
-    "not_initialized": "status-box status-ready",
-    "ready": "status-box status-ready",
-    "recording": "status-box status-recording",
-    "in_meeting": "status-box status-recording",
-    "error": "status-box status-error",
-    "stopped": "status-box status-stopped",
-}.get(status["status"], "status-box")
-
-status_text = status["status"].upper().replace("_", " ")
+status_class = STATUS_CLASSES[status["status"]]
+
+status_text = status["status"].label
 if status["details"]:
     status_text += f" - {status['details']}"
 
@@ -225,18 +233,18 @@ with col2:
     if not st.session_state.initialized:
         if st.button("🚀 Initialize", use_container_width=True):
             with st.spinner("Initializing..."):
-                asyncio.run(initialize_assistant())
+                run_async(initialize_assistant(), timeout=30)
                 st.rerun()
 
     elif not st.session_state.is_running:
         if st.button("▶️ Start Meeting", use_container_width=True, disabled=not meeting_url):
             with st.spinner("Starting meeting..."):
-                asyncio.run(start_meeting(meeting_url, meeting_password or None, audio_device_id))
+                run_async(start_meeting(meeting_url, meeting_password or None, audio_device_id), timeout=180)
                 st.rerun()
     else:
         if st.button("⏹️ Stop Meeting", use_container_width=True):
             with st.spinner("Stopping meeting..."):
-                asyncio.run(stop_meeting())
+                run_async(stop_meeting(), timeout=60)
                 st.rerun()
 
 st.markdown("---")
@@ -247,56 +255,44 @@ col_transcript, col_summaries = st.columns([1, 1])
 with col_transcript:
     st.subheader("📝 Live Transcript")
 
-    # Transcript display
-    transcript_container = st.container()
+    # Transcript display (last 50 lines)
+    transcript_placeholder = st.empty()
 
-    with transcript_container:
-        if st.session_state.transcripts:
-            transcript_text = ""
-            for t in st.session_state.transcripts[-50:]:  # Show last 50
-                transcript_text += f"[{t['timestamp']}] {t['text']}\n\n"
-
-            st.markdown(f'<div class="transcript-box">{transcript_text}</div>', unsafe_allow_html=True)
-        else:
-            st.info("Waiting for transcript data...")
+    if st.session_state.transcript_lines:
+        transcript_placeholder.code("\n\n".join(st.session_state.transcript_lines), language=None)
+    else:
+        transcript_placeholder.info("Waiting for transcript data...")
 
-    # Auto-refresh button
+    # Auto-refresh while recording, capped at 2 reruns/sec - transcript
+    # callbacks only buffer and never trigger a rerun themselves
     if st.session_state.is_running:
-        if st.button("🔄 Refresh Transcript"):
-            st.rerun()
+        st_autorefresh(interval=500, key="live_refresh")
 
 with col_summaries:
     st.subheader("📊 AI Summaries")
 
+    # Snapshot of the summary being generated right now, refreshed by the autorefresh
+    # rerun; the final parsed summary lands in session_state via on_summary once it completes
+    assistant = st.session_state.assistant
+    if assistant and assistant.is_summarizing:
+        with st.expander("Summary in progress...", expanded=True):
+            st.markdown(assistant.summary_in_progress or "_Waiting for Claude..._")
+
     # Summaries display
-    if st.session_state.summaries:
-        for i, summary in enumerate(reversed(st.session_state.summaries), 1):
-            with st.expander(f"Summary {len(st.session_state.summaries) - i + 1} - {summary.get('timestamp', '')[:19]}"):
+    summaries = st.session_state.summaries
+    if summaries:
+        # Newest first
+        for idx in range(len(summaries) - 1, -1, -1):
+            summary = summaries[idx]
+            with st.expander(f"Summary {idx + 1} - {summary.get('timestamp', '')[:19]}"):
                 if "parsed" in summary and summary["parsed"]:
                     parsed = summary["parsed"]
 
-                    if parsed.get("overview"):
-                        st.markdown(f"**Overview:** {parsed['overview']}")
-
-                    if parsed.get("key_points"):
-                        st.markdown("**Key Points:**")
-                        for point in parsed["key_points"]:
-                            st.markdown(f"- {point}")
-
-                    if parsed.get("decisions"):
-                        st.markdown("**Decisions:**")
-                        for decision in parsed["decisions"]:
-                            st.markdown(f"- {decision}")
-
-                    if parsed.get("action_items"):
-                        st.markdown("**Action Items:**")
-                        for item in parsed["action_items"]:
-                            st.markdown(f"- {item}")
-
-                    if parsed.get("questions"):
-                        st.markdown("**Questions/Concerns:**")
-                        for question in parsed["questions"]:
-                            st.markdown(f"- {question}")
+                    for _, label, is_list, value in iter_sections(parsed):
+                        if is_list:
+                            st.markdown(f"**{label}:**\n" + "\n".join(f"- {item}" for item in value))
+                        else:
+                            st.markdown(f"**{label}:** {value}")
                 else:
                     st.markdown(summary.get("summary", ""))
     else:
@@ -309,50 +305,39 @@ st.subheader("💾 Export")
 
 col_export1, col_export2, col_export3 = st.columns(3)
 
+# Export content is generated lazily, only when a download is actually clicked
+assistant = st.session_state.assistant
+export_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
 with col_export1:
-    if st.button("📄 Export as Markdown", use_container_width=True):
-        if st.session_state.assistant:
-            export_content = st.session_state.assistant.export_meeting(format="markdown")
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"meeting_{timestamp}.md"
-
-            st.download_button(
-                label="⬇️ Download Markdown",
-                data=export_content,
-                file_name=filename,
-                mime="text/markdown",
-                use_container_width=True,
-            )
+    st.download_button(
+        label="📄 Export as Markdown",
+        data=lambda: assistant.export_meeting(format="markdown"),
+        file_name=f"meeting_{export_timestamp}.md",
+        mime="text/markdown",
+        disabled=assistant is None,
+        use_container_width=True,
+    )
 
 with col_export2:
-    if st.button("📋 Export as Text", use_container_width=True):
-        if st.session_state.assistant:
-            export_content = st.session_state.assistant.export_meeting(format="text")
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"meeting_{timestamp}.txt"
-
-            st.download_button(
-                label="⬇️ Download Text",
-                data=export_content,
-                file_name=filename,
-                mime="text/plain",
-                use_container_width=True,
-            )
+    st.download_button(
+        label="📋 Export as Text",
+        data=lambda: assistant.export_meeting(format="text"),
+        file_name=f"meeting_{export_timestamp}.txt",
+        mime="text/plain",
+        disabled=assistant is None,
+        use_container_width=True,
+    )
 
 with col_export3:
-    if st.button("🗂️ Export as JSON", use_container_width=True):
-        if st.session_state.assistant:
-            export_content = st.session_state.assistant.export_meeting(format="json")
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"meeting_{timestamp}.json"
-
-            st.download_button(
-                label="⬇️ Download JSON",
-                data=export_content,
-                file_name=filename,
-                mime="application/json",
-                use_container_width=True,
-            )
+    st.download_button(
+        label="🗂️ Export as JSON",
+        data=lambda: assistant.export_meeting(format="json"),
+        file_name=f"meeting_{export_timestamp}.json",
+        mime="application/json",
+        disabled=assistant is None,
+        use_container_width=True,
+    )
 
 # Footer
 st.markdown("---")
@@ -5,38 +5,38 @@ CLI interface for Google Meet Assistant
 import asyncio
 import argparse
 import logging
+import logging.handlers
+import os
 import signal
 import sys
 from pathlib import Path
 from datetime import datetime
 
 from src.meeting_manager import MeetingAssistant
+from src.meet_joiner import shutdown_shared_browser
+from src.summarizer import shutdown_shared_http_client
 from src.config import Config
 from src.audio_capture import VirtualAudioRouter, list_audio_devices
+from src.summary_view import iter_sections
+
+# Configure logging - file writes are buffered and flushed in batches (or immediately on errors)
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+Config.LOGS_DIR.mkdir(exist_ok=True)
+log_file = logging.FileHandler(Config.LOGS_DIR / "meeting_assistant.log")
+log_file.setFormatter(logging.Formatter(LOG_FORMAT))
 
-# Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(), logging.FileHandler("logs/meeting_assistant.log")],
+    format=LOG_FORMAT,
+    handlers=[
+        logging.StreamHandler(),
+        logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=log_file),
+    ],
 )
 
 logger = logging.getLogger(__name__)
 
-# Global assistant instance for cleanup
-assistant = None
-
-
-def signal_handler(sig, frame):
-    """Handle Ctrl+C gracefully"""
-    print("\n\n⚠️  Interrupt received, stopping meeting...")
-    if assistant:
-        asyncio.create_task(assistant.cleanup())
-    sys.exit(0)
-
-
-signal.signal(signal.SIGINT, signal_handler)
-
 
 def print_banner():
     """Print application banner"""
@@ -53,23 +53,27 @@ def print_banner():
     )
 
 
+# Emoji for each assistant status, indexed by Status value
+STATUS_EMOJI = [
+    "ℹ️ ",  # NOT_INITIALIZED
+    "✅",  # READY
+    "⏺️ ",  # RECORDING
+    "📹",  # IN_MEETING
+    "❌",  # ERROR
+    "🛑",  # STOPPED
+    "🔧",  # INITIALIZING
+    "🚪",  # JOINING
+    "⏹️ ",  # STOPPING
+    "ℹ️ ",  # CLOSED
+]
+
+
 def print_status_update(status):
     """Print status updates"""
-    status_emoji = {
-        "initializing": "🔧",
-        "ready": "✅",
-        "joining": "🚪",
-        "in_meeting": "📹",
-        "recording": "⏺️ ",
-        "stopping": "⏹️ ",
-        "stopped": "🛑",
-        "error": "❌",
-    }
-
-    emoji = status_emoji.get(status["status"], "ℹ️ ")
-    timestamp = status.get("timestamp", "")[:19]
-
-    print(f"\n{emoji} [{timestamp}] {status['status'].upper()}", end="")
+    emoji = STATUS_EMOJI[status["status"]]
+    timestamp = datetime.fromtimestamp(status["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+
+    print(f"\n{emoji} [{timestamp}] {status['status'].label}", end="")
     if status.get("details"):
         print(f" - {status['details']}", end="")
     print()
@@ -92,32 +96,14 @@ def print_summary(summary):
     if "parsed" in summary and summary["parsed"]:
         parsed = summary["parsed"]
 
-        if parsed.get("overview"):
-            print(f"\n📌 Overview:\n{parsed['overview']}\n")
-
-        if parsed.get("key_points"):
-            print("🔑 Key Points:")
-            for point in parsed["key_points"]:
-                print(f"  • {point}")
-            print()
-
-        if parsed.get("decisions"):
-            print("✅ Decisions:")
-            for decision in parsed["decisions"]:
-                print(f"  • {decision}")
-            print()
-
-        if parsed.get("action_items"):
-            print("📋 Action Items:")
-            for item in parsed["action_items"]:
-                print(f"  • {item}")
-            print()
-
-        if parsed.get("questions"):
-            print("❓ Questions/Concerns:")
-            for question in parsed["questions"]:
-                print(f"  • {question}")
-            print()
+        for emoji, label, is_list, value in iter_sections(parsed):
+            if is_list:
+                print(f"{emoji} {label}:")
+                for item in value:
+                    print(f"  • {item}")
+                print()
+            else:
+                print(f"\n{emoji} {label}:\n{value}\n")
     else:
         print(summary.get("summary", ""))
 
@@ -126,7 +112,31 @@ def print_summary(summary):
 
 async def run_meeting(meeting_url: str, password: str = None, audio_device_id: int = None, export_format: str = "markdown"):
     """Run the meeting assistant"""
-    global assistant
+    assistant = None
+    stop_task = None
+    interrupted = False
+    starting = True  # Initializing or joining, before the main loop or cleanup
+    loop = asyncio.get_running_loop()
+    main_task = asyncio.current_task()
+
+    def handle_interrupt():
+        """Handle Ctrl+C: stop the meeting, or abort startup if it is not running yet; a second Ctrl+C forces exit"""
+        nonlocal stop_task, interrupted
+        if interrupted:
+            print("\n⚠️  Second interrupt, exiting immediately")
+            logging.shutdown()  # os._exit skips atexit, so flush the buffered log records first
+            os._exit(130)
+        interrupted = True
+
+        if assistant is not None and assistant.is_running:
+            print("\n\n⚠️  Interrupt received, stopping meeting... (Ctrl+C again to force exit)")
+            stop_task = asyncio.create_task(assistant.stop_meeting())
+        elif starting:
+            # Still initializing or joining - stop_meeting() would be a no-op
+            print("\n\n⚠️  Interrupt received, aborting startup... (Ctrl+C again to force exit)")
+            main_task.cancel()
+        else:
+            print("\n\n⚠️  Already stopping... (Ctrl+C again to force exit)")
 
     try:
         # Validate config
@@ -137,6 +147,11 @@ async def run_meeting(meeting_url: str, password: str = None, audio_device_id: i
             on_transcript=print_transcript, on_summary=print_summary, on_status_change=print_status_update
         )
 
+        try:
+            loop.add_signal_handler(signal.SIGINT, handle_interrupt)
+        except NotImplementedError:
+            pass  # Windows - Ctrl+C falls back to KeyboardInterrupt below
+
         # Initialize
         print("\n🔧 Initializing components...")
         await assistant.initialize()
@@ -147,6 +162,7 @@ async def run_meeting(meeting_url: str, password: str = None, audio_device_id: i
             print("🔒 Using provided password")
 
         await assistant.start_meeting(meeting_url, password, audio_device_id)
+        starting = False
 
         print(
             f"""
@@ -166,15 +182,22 @@ Press Ctrl+C to stop the meeting and export results
     except KeyboardInterrupt:
         print("\n\n⚠️  Stopping meeting...")
 
+    except asyncio.CancelledError:
+        pass  # Startup aborted by handle_interrupt
+
     except Exception as e:
         logger.error(f"Error running meeting: {e}")
         print(f"\n❌ Error: {e}")
 
     finally:
         # Cleanup and export
+        starting = False
         if assistant:
             print("\n🛑 Stopping meeting and generating final summary...")
-            await assistant.stop_meeting()
+            if stop_task:
+                await stop_task
+            else:
+                await assistant.stop_meeting()
 
             # Export results
             print(f"\n💾 Exporting meeting data ({export_format} format)...")
@@ -191,7 +214,7 @@ Press Ctrl+C to stop the meeting and export results
             else:
                 filename = export_dir / f"meeting_{timestamp}.md"
 
-            filename.write_text(export_content)
+            filename.write_text(export_content, encoding="utf-8")
 
             print(f"✅ Meeting data exported to: {filename}")
 
@@ -208,6 +231,8 @@ Press Ctrl+C to stop the meeting and export results
 
             # Cleanup
             await assistant.cleanup()
+            await shutdown_shared_browser()
+            await shutdown_shared_http_client()
 
         print("\n👋 Goodbye!\n")
 
@@ -0,0 +1,72 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled version of summary_parser.parse_summary
+
+Optional: build in place with `cythonize -i src/_parse.pyx`. Without the built
+extension the pure-Python parser in summary_parser.py is used, with identical results.
+"""
+
+# Section keywords in summary_parser._section_of priority order, and the parsed field each one starts
+cdef tuple _KEYWORDS = (
+    ("key discussion", "key_points"),
+    ("discussion points", "key_points"),
+    ("decision", "decisions"),
+    ("action item", "action_items"),
+    ("question", "questions"),
+    ("concern", "questions"),
+    ("overall summary", "overview"),
+)
+
+
+cdef object _find_section(str line):
+    """Return the section for the highest-priority keyword in line, or None"""
+    cdef str lower = line.lower()
+    cdef str keyword, name
+
+    for keyword, name in _KEYWORDS:
+        if keyword in lower:
+            return name
+    return None
+
+
+def parse_summary(str summary_text):
+    """
+    Parse structured summary from Claude's response
+
+    Returns:
+        Dictionary with categorized content
+    """
+    cdef dict parsed = {
+        "key_points": [],
+        "decisions": [],
+        "action_items": [],
+        "questions": [],
+        "overview": "",
+    }
+    cdef list overview = []
+    cdef object current_section = None
+    cdef object section
+    cdef str raw, line, prefix
+
+    for raw in summary_text.split("\n"):
+        line = raw.strip()
+
+        if not line:
+            continue
+
+        prefix = line[:2]
+        if prefix == "- " or prefix == "* ":
+            # Bullet point - add to current section
+            if current_section is not None and current_section != "overview":
+                (<list>parsed[current_section]).append(line[2:].strip())
+            continue
+
+        # Detect sections
+        section = _find_section(line)
+        if section is not None:
+            current_section = section
+        elif current_section == "overview" and not line.startswith("#"):
+            overview.append(line)
+
+    parsed["overview"] = " ".join(overview)
+    return parsed
@@ -1,18 +1,112 @@
 """
 Audio capture from system audio or browser
 """
+import array
 import asyncio
+import functools
 import logging
-import queue
+import platform
 import threading
 from typing import Optional, Callable
 import sounddevice as sd
 import numpy as np
 from .config import Config
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 
+def _pcm_downmix_loop(indata_i16, out_i16):
+    """Average interleaved PCM16 channels into a mono PCM16 block in a single pass"""
+    channels = indata_i16.shape[1]
+    for i in range(out_i16.shape[0]):
+        s = 0
+        for c in range(channels):
+            s += np.int32(indata_i16[i, c])
+        out_i16[i] = np.int16(s // channels)
+
+
+def _pcm_downmix_numpy(indata_i16, out_i16):
+    """NumPy fallback for pcm_downmix when Numba is not installed"""
+    np.floor_divide(indata_i16.sum(axis=1, dtype=np.int32), indata_i16.shape[1], out=out_i16, casting="unsafe")
+
+
+if njit:
+    pcm_downmix = njit(cache=True)(_pcm_downmix_loop)
+else:
+    pcm_downmix = _pcm_downmix_numpy
+
+
+class SPSCRing:
+    """
+    Single-producer single-consumer ring of fixed-size PCM16 blocks
+
+    The PortAudio callback is the only writer and the transcription loop the
+    only reader, so each side owns one index and no lock is needed. Index
+    stores are atomic under the GIL; the event only wakes an idle reader.
+    """
+
+    def __init__(self, capacity: int, block_len: int):
+        self.capacity = capacity
+        self.buf = np.empty((capacity, block_len), dtype=np.int16)
+        self._lengths = array.array("Q", [0] * capacity)
+        self._w = array.array("Q", [0])
+        self._r = array.array("Q", [0])
+        self._evt = threading.Event()
+
+    def __len__(self) -> int:
+        return self._w[0] - self._r[0]
+
+    def reserve(self) -> Optional[np.ndarray]:
+        """
+        Get the next free slot for writing in place (producer side)
+
+        Returns:
+            Full-length view of the slot, or None if the ring is full
+        """
+        w = self._w[0]
+        if w - self._r[0] >= self.capacity:
+            return None
+        return self.buf[w % self.capacity]
+
+    def commit(self, frames: int):
+        """Publish the slot returned by reserve() holding `frames` samples (producer side)"""
+        w = self._w[0]
+        self._lengths[w % self.capacity] = frames
+        self._w[0] = w + 1
+        self._evt.set()
+
+    def pop(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """
+        Take the oldest block as bytes (consumer side)
+
+        Args:
+            timeout: Maximum time to wait for a block
+
+        Returns:
+            PCM16 bytes or None if timeout
+        """
+        r = self._r[0]
+        if r == self._w[0]:
+            self._evt.clear()
+            # Re-check after clearing so a push in between is not missed
+            if r == self._w[0] and not self._evt.wait(timeout):
+                return None
+
+        slot = r % self.capacity
+        data = self.buf[slot, : self._lengths[slot]].tobytes()
+        self._r[0] = r + 1
+        return data
+
+    def clear(self):
+        """Discard all pending blocks (consumer side)"""
+        self._r[0] = self._w[0]
+
+
 class AudioCapturer:
     """Captures audio from system input"""
 
@@ -21,11 +115,15 @@ class AudioCapturer:
         sample_rate: int = Config.SAMPLE_RATE,
         channels: int = Config.CHANNELS,
         callback: Optional[Callable] = None,
+        ring_depth: int = 64,
     ):
         self.sample_rate = sample_rate
         self.channels = channels
         self.callback = callback
-        self.audio_queue = queue.Queue()
+        self.blocksize = int(self.sample_rate * Config.AUDIO_BLOCK_MS / 1000)
+
+        # Preallocated PCM16 ring shared lock-free with the transcription loop
+        self.audio_ring = SPSCRing(ring_depth, self.blocksize)
         self.stream = None
         self.is_recording = False
         self._recording_thread = None
@@ -55,16 +153,33 @@ class AudioCapturer:
             if device_id is not None:
                 logger.info(f"Using device ID: {device_id}")
 
+            # Warm up the downmix kernel so JIT compilation doesn't land on the first block
+            if self.channels > 1:
+                pcm_downmix(
+                    np.zeros((self.blocksize, self.channels), dtype=np.int16),
+                    np.empty(self.blocksize, dtype=np.int16),
+                )
+
             def audio_callback(indata, frames, time_info, status):
                 """Called for each audio block"""
                 if status:
                     logger.warning(f"Audio callback status: {status}")
 
-                # Convert to bytes and add to queue
-                audio_data = indata.copy()
+                # Copy the PCM16 block straight into the next ring slot
+                slot = self.audio_ring.reserve()
+                if slot is None:
+                    logger.warning("Audio ring full, dropping block")
+                    return
 
-                # Put in queue for transcription
-                self.audio_queue.put(audio_data)
+                frames = min(frames, self.blocksize)
+                audio_data = slot[:frames]
+                if self.channels == 1:
+                    audio_data[:] = indata[:frames, 0]
+                else:
+                    pcm_downmix(indata[:frames], audio_data)
+
+                # Hand off to the transcription loop
+                self.audio_ring.commit(frames)
 
                 # Call custom callback if provided
                 if self.callback:
@@ -73,13 +188,15 @@ class AudioCapturer:
                     except Exception as e:
                         logger.error(f"Error in audio callback: {e}")
 
-            # Open audio stream
+            # Open audio stream - request PCM16 so blocks need no float conversion,
+            # both AssemblyAI and Deepgram (encoding="linear16") stream it as-is
             self.stream = sd.InputStream(
                 device=device_id,
                 channels=self.channels,
                 samplerate=self.sample_rate,
+                dtype="int16",
                 callback=audio_callback,
-                blocksize=int(self.sample_rate * 0.1),  # 100ms blocks
+                blocksize=self.blocksize,
             )
 
             self.stream.start()
@@ -109,28 +226,22 @@ class AudioCapturer:
         except Exception as e:
             logger.error(f"Error stopping audio capture: {e}")
 
-    def get_audio_chunk(self, timeout: float = 1.0) -> Optional[np.ndarray]:
+    def get_audio_chunk(self, timeout: float = 1.0) -> Optional[bytes]:
         """
-        Get next audio chunk from queue
+        Get next audio chunk from the ring buffer
 
         Args:
             timeout: Maximum time to wait for audio data
 
         Returns:
-            Audio data as numpy array or None if timeout
+            One AUDIO_BLOCK_MS frame of mono PCM16 (linear16) bytes, ready to
+            send to the transcription service without rechunking, or None if timeout
         """
-        try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        return self.audio_ring.pop(timeout=timeout)
 
     def clear_queue(self):
         """Clear the audio queue"""
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        self.audio_ring.clear()
 
 
 class VirtualAudioRouter:
@@ -144,10 +255,9 @@ class VirtualAudioRouter:
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_setup_instructions():
-        """Get platform-specific setup instructions"""
-        import platform
-
+        """Get platform-specific setup instructions (computed once per process)"""
         os_name = platform.system()
 
         if os_name == "Linux":
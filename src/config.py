@@ -22,19 +22,48 @@ class Config:
 
     # Summary settings
     SUMMARY_INTERVAL_MINUTES = int(os.getenv("SUMMARY_INTERVAL_MINUTES", "5"))
+    # Summarize early once this many characters of new transcript have arrived
+    SUMMARY_CHAR_THRESHOLD = int(os.getenv("SUMMARY_CHAR_THRESHOLD", "4000"))
     CLAUDE_MODEL = os.getenv("CLAUDE_MODEL", "claude-sonnet-4-20250514")
+    # "optimized" requests lower-latency serving where the provider supports it; "standard" otherwise
+    CLAUDE_LATENCY_MODE = os.getenv("CLAUDE_LATENCY_MODE", "standard")
+    # Transcripts longer than one window are summarized window-by-window first, then combined
+    SUMMARY_WINDOW_WORDS = int(os.getenv("SUMMARY_WINDOW_WORDS", "1024"))
+    SUMMARY_WINDOW_OVERLAP = 128  # Words repeated between consecutive windows
+    MAX_INPUT_TOKENS = int(os.getenv("MAX_INPUT_TOKENS", "200000"))  # Claude model context window
+    SUMMARY_MAX_CONCURRENCY = int(os.getenv("SUMMARY_MAX_CONCURRENCY", "4"))  # Parallel window requests
+    # Reuse an earlier summary when a transcript is at least this similar to its transcript (1.0 = identical)
+    SUMMARY_CACHE_SIMILARITY = float(os.getenv("SUMMARY_CACHE_SIMILARITY", "0.92"))
 
     # Google Meet settings
     MEET_DISPLAY_NAME = os.getenv("MEET_DISPLAY_NAME", "Meeting Assistant Bot")
+    MEET_HEADLESS = os.getenv("MEET_HEADLESS", "true").lower() in ("1", "true", "yes")
+    # When not headless, keep the window off-screen (e.g. if Meet rejects headless browsers)
+    MEET_OFFSCREEN = os.getenv("MEET_OFFSCREEN", "false").lower() in ("1", "true", "yes")
+
+    # Zoom settings (ZoomJoiner)
+    ZOOM_DISPLAY_NAME = os.getenv("ZOOM_DISPLAY_NAME", MEET_DISPLAY_NAME)
+    ZOOM_HEADLESS = os.getenv("ZOOM_HEADLESS", "true").lower() in ("1", "true", "yes")
 
     # Directories
     BASE_DIR = Path(__file__).parent.parent
     EXPORTS_DIR = BASE_DIR / "exports"
     LOGS_DIR = BASE_DIR / "logs"
+    # Meet cookies/localStorage saved between runs so later joins can skip the guest flow
+    MEET_STORAGE_STATE_PATH = Path(os.getenv("MEET_STORAGE_STATE_PATH", str(BASE_DIR / ".meet_state.json")))
+    # Optional persistent Chrome profile (keeps cookies and code caches; takes precedence over the state file)
+    CHROME_PROFILE_DIR = Path(os.environ["CHROME_PROFILE_DIR"]) if os.getenv("CHROME_PROFILE_DIR") else None
 
     # Audio settings
     SAMPLE_RATE = 16000  # 16kHz for speech recognition
     CHANNELS = 1  # Mono
+    # Small capture blocks keep the reader responsive, but AssemblyAI rejects sends under 100 ms:
+    # the processing loop joins TRANSCRIBE_BATCH blocks per send, and validate() checks the product
+    AUDIO_BLOCK_MS = int(os.getenv("AUDIO_BLOCK_MS", "50"))
+    TRANSCRIBE_BATCH = int(os.getenv("TRANSCRIBE_BATCH", "4"))  # Audio blocks per transcription send
+    TRANSCRIBE_FLUSH_SECONDS = 0.75  # Max time a partial batch waits before being sent
+
+    _dirs_created = False
 
     @classmethod
     def validate(cls):
@@ -44,16 +73,20 @@ class Config:
         if not cls.ANTHROPIC_API_KEY:
             errors.append("ANTHROPIC_API_KEY is required")
 
-        if cls.TRANSCRIPTION_SERVICE == "assemblyai" and not cls.ASSEMBLYAI_API_KEY:
+        if cls.TRANSCRIPTION_SERVICE in ("assemblyai", "race") and not cls.ASSEMBLYAI_API_KEY:
             errors.append("ASSEMBLYAI_API_KEY is required for AssemblyAI transcription")
-        elif cls.TRANSCRIPTION_SERVICE == "deepgram" and not cls.DEEPGRAM_API_KEY:
+        if cls.TRANSCRIPTION_SERVICE in ("deepgram", "race") and not cls.DEEPGRAM_API_KEY:
             errors.append("DEEPGRAM_API_KEY is required for Deepgram transcription")
+        if cls.TRANSCRIPTION_SERVICE in ("assemblyai", "race") and cls.AUDIO_BLOCK_MS * cls.TRANSCRIBE_BATCH < 100:
+            errors.append("AUDIO_BLOCK_MS * TRANSCRIBE_BATCH must be at least 100 (AssemblyAI's minimum chunk)")
 
         if errors:
             raise ValueError(f"Configuration errors:\n" + "\n".join(f"  - {e}" for e in errors))
 
-        # Create directories
-        cls.EXPORTS_DIR.mkdir(exist_ok=True)
-        cls.LOGS_DIR.mkdir(exist_ok=True)
+        # Create directories (once per process)
+        if not cls._dirs_created:
+            cls.EXPORTS_DIR.mkdir(exist_ok=True)
+            cls.LOGS_DIR.mkdir(exist_ok=True)
+            cls._dirs_created = True
 
         return True
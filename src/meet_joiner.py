@@ -2,48 +2,327 @@
 Google Meet meeting automation using Playwright
 """
 import asyncio
+import json
 import logging
-from typing import Optional
-from playwright.async_api import async_playwright, Page, Browser
+import os
+import random
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, Dict, List, Optional, TypeVar
+from playwright.async_api import async_playwright, Playwright, Page, Browser, BrowserContext, Locator
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Browsers shared by all MeetJoiners, per event loop and keyed by launch options, as
+# [playwright, browser, users]. Playwright objects are bound to the loop that created them.
+# Weakly keyed, so this registry never keeps a discarded loop alive; the browser itself is
+# closed by release_shared_browser() once its last user is done with it.
+_shared_browsers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, list]]" = (
+    weakref.WeakKeyDictionary()
+)
+_shared_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+@asynccontextmanager
+async def _file_lock(path, timeout: float = 10.0, stale: float = 30.0):
+    """
+    Hold a lock file next to path so concurrent processes don't interleave state writes
+
+    Args:
+        path: File being protected; the lock is path + ".lock"
+        timeout: Seconds to wait for the lock before giving up
+        stale: Age in seconds after which an abandoned lock file is removed
+    """
+    lock_path = f"{path}.lock"
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > stale:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for {lock_path}")
+            await asyncio.sleep(0.05)
+
+    try:
+        yield
+    finally:
+        os.close(fd)
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+
+async def get_shared_browser(headless: bool, args: List[str]) -> Browser:
+    """
+    Get a Chromium instance shared across MeetJoiners, launching it on first use
+
+    Each call counts as one user; pair it with release_shared_browser().
+
+    Args:
+        headless: Whether to launch headless
+        args: Chromium command line arguments
+
+    Returns:
+        A connected Browser
+    """
+    loop = asyncio.get_running_loop()
+    lock = _shared_locks.get(loop)
+    if lock is None:
+        lock = _shared_locks[loop] = asyncio.Lock()
+
+    async with lock:
+        browsers = _shared_browsers.setdefault(loop, {})
+        key = (headless, tuple(args))
+        shared = browsers.get(key)
+
+        if shared is None or not shared[1].is_connected():
+            if shared is not None:
+                await shared[0].stop()
+
+            logger.info("Launching shared browser...")
+            playwright = await async_playwright().start()
+            browser = await playwright.chromium.launch(headless=headless, args=args)
+            # Users of a replaced (disconnected) browser release that one, not this one
+            shared = browsers[key] = [playwright, browser, 0]
+
+        shared[2] += 1
+        return shared[1]
+
+
+async def release_shared_browser(browser: Browser):
+    """
+    Drop one use of a shared browser, closing it once its last user has released it
+
+    Args:
+        browser: Browser returned by get_shared_browser()
+    """
+    loop = asyncio.get_running_loop()
+    browsers = _shared_browsers.get(loop, {})
+    for key, shared in list(browsers.items()):
+        if shared[1] is browser:
+            shared[2] -= 1
+            if shared[2] <= 0:
+                del browsers[key]
+                if not browsers:
+                    _shared_browsers.pop(loop, None)
+                await _close_shared(*shared[:2])
+            return
+
+
+async def _close_shared(playwright: Playwright, browser: Browser):
+    """Close a shared browser and stop its Playwright instance"""
+    try:
+        await browser.close()
+        await playwright.stop()
+        logger.info("Shared browser closed")
+    except Exception as e:
+        logger.error(f"Error closing shared browser: {e}")
+
+
+async def shutdown_shared_browser():
+    """Close every shared browser created on the current event loop, whether or not it is still in use"""
+    loop = asyncio.get_running_loop()
+
+    for playwright, browser, _ in _shared_browsers.pop(loop, {}).values():
+        await _close_shared(playwright, browser)
+
+    _shared_locks.pop(loop, None)
+
+
+async def _retry(
+    coro_factory: Callable[[], Awaitable[T]],
+    attempts: int = 3,
+    base: float = 1.0,
+    cap: float = 5.0,
+    mult: float = 2.0,
+) -> T:
+    """
+    Run a Playwright action, retrying transient failures with capped exponential backoff
+
+    Args:
+        coro_factory: Zero-argument callable returning a fresh awaitable per attempt
+        attempts: Maximum number of attempts
+        base: Delay before the first retry in seconds
+        cap: Maximum delay between retries in seconds
+        mult: Backoff multiplier
+
+    Returns:
+        The result of the first successful attempt (the last error is re-raised)
+    """
+    for attempt in range(attempts):
+        try:
+            return await coro_factory()
+        except PlaywrightError as e:
+            if attempt == attempts - 1:
+                raise
+            delay = min(cap, base * mult**attempt) + random.uniform(0, 0.25)
+            logger.warning(f"Attempt {attempt + 1}/{attempts} failed ({e}), retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+
 
 class MeetJoiner:
     """Handles joining Google Meet meetings via browser automation"""
 
-    def __init__(self, display_name: Optional[str] = None):
+    # Combined selector lists, so each check is a single DOM query
+    IN_MEETING_SELECTOR = ", ".join(
+        [
+            "button[aria-label*='microphone' i]",  # Also matches "Turn on/off microphone"
+            "button[aria-label*='Leave call' i]",
+            "button[aria-label*='End call' i]",
+            "div[data-meeting-title]",
+            "div[data-self-name]",
+            "[data-fps-request-screencast-cap]",
+        ]
+    )
+    # Only rendered once admitted - the lobby also has a microphone toggle
+    ADMITTED_SELECTOR = ", ".join(
+        [
+            "button[aria-label*='Leave call' i]",
+            "button[aria-label*='End call' i]",
+            "div[data-meeting-title]",
+        ]
+    )
+    LEAVE_SELECTOR = ", ".join(
+        [
+            "button[aria-label*='Leave call' i]",
+            "button[aria-label*='End call' i]",
+            "button:has-text('Leave call')",
+            "button:has-text('End call')",
+        ]
+    )
+
+    # In-page check for a visible element matching a selector, run in a single evaluate() round-trip
+    _IN_MEETING_JS = """(selector) => Array.from(document.querySelectorAll(selector)).some(
+        (el) => (el.checkVisibility ? el.checkVisibility() : el.offsetParent !== null)
+    )"""
+
+    # Seconds an element already in the DOM gets to become visible (see _first_visible)
+    PRESENT_VISIBLE_TIMEOUT = 0.5
+
+    def __init__(self, display_name: Optional[str] = None, headless: Optional[bool] = None):
         self.display_name = display_name or Config.MEET_DISPLAY_NAME
+        self.headless = Config.MEET_HEADLESS if headless is None else headless
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
+        self._playwright: Optional[Playwright] = None  # Only set for a persistent profile context
         self.page: Optional[Page] = None
-        self.playwright = None
         self._is_in_meeting = False
+        self._loc_cache: Dict[str, Locator] = {}
 
     async def initialize(self):
-        """Initialize Playwright browser"""
+        """
+        Initialize a browser context
+
+        Uses a persistent Chrome profile when Config.CHROME_PROFILE_DIR is set,
+        otherwise a fresh context on the shared Playwright browser.
+        """
         logger.info("Initializing browser...")
-        self.playwright = await async_playwright().start()
-
-        # Launch browser with audio capture capabilities
-        self.browser = await self.playwright.chromium.launch(
-            headless=False,  # Run in headed mode to see the meeting
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--enable-usermedia-screen-capturing",  # Enable screen/audio capture
-                "--auto-select-desktop-capture-source=Entire screen",  # Auto-select capture source
-            ],
+
+        # Launch browser with audio capture capabilities. Audio is not muted:
+        # meeting audio reaches the app through the system loopback device
+        args = [
+            "--disable-blink-features=AutomationControlled",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--enable-usermedia-screen-capturing",  # Enable screen/audio capture
+            # Nothing the bot needs, all of it costs startup time
+            "--disable-extensions",
+            "--disable-default-apps",
+            "--disable-background-networking",
+            "--disable-features=Translate,BackForwardCache",
+        ]
+
+        if self.headless:
+            args.append("--disable-gpu")
+        else:
+            args.append("--auto-select-desktop-capture-source=Entire screen")  # Auto-select capture source
+            if Config.MEET_OFFSCREEN:
+                # Headed (for sites that reject headless) but out of sight
+                args += ["--window-position=-32000,-32000", "--window-size=1,1"]
+
+        if Config.CHROME_PROFILE_DIR:
+            context = await self._launch_persistent(args)
+        else:
+            context = await self._new_shared_context(args)
+
+        # Fail fast on slow actions - join_meeting retries and polls for readiness itself
+        context.set_default_navigation_timeout(8000)
+        context.set_default_timeout(4000)
+
+        self.page = context.pages[0] if context.pages else await context.new_page()
+        self._loc_cache.clear()
+        logger.info("Browser initialized successfully")
+
+    async def _launch_persistent(self, args: List[str]) -> BrowserContext:
+        """
+        Launch Chromium on the persistent profile in Config.CHROME_PROFILE_DIR
+
+        The profile keeps cookies and V8/service-worker caches between runs, so it
+        replaces the saved storage state. A profile can only be open in one browser,
+        so this context gets its own Playwright instance instead of the shared one.
+
+        Args:
+            args: Chromium command line arguments
+
+        Returns:
+            The persistent browser context
+        """
+        logger.info(f"Using Chrome profile: {Config.CHROME_PROFILE_DIR}")
+        self._playwright = await async_playwright().start()
+        self.context = await self._playwright.chromium.launch_persistent_context(
+            user_data_dir=str(Config.CHROME_PROFILE_DIR),
+            headless=self.headless,
+            args=args,
+            permissions=["microphone", "camera"],
+            viewport={"width": 1280, "height": 720},
         )
+        self.browser = self.context.browser
+        return self.context
+
+    async def _new_shared_context(self, args: List[str]) -> BrowserContext:
+        """
+        Create a context on the shared browser, restoring any saved storage state
+
+        Args:
+            args: Chromium command line arguments
+
+        Returns:
+            The new browser context
+        """
+        self.browser = await get_shared_browser(self.headless, args)
+
+        # Reuse cookies from a previous run so Meet can skip the guest/name prompts
+        state_path = Config.MEET_STORAGE_STATE_PATH
+        storage_state = None
+        if state_path.exists():
+            try:
+                async with _file_lock(state_path):
+                    storage_state = json.loads(state_path.read_text())
+                logger.info(f"Restoring browser state from {state_path}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable browser state {state_path}: {e}")
 
         # Create context with audio permissions
-        context = await self.browser.new_context(
+        self.context = await self.browser.new_context(
             permissions=["microphone", "camera"],
             viewport={"width": 1280, "height": 720},
+            storage_state=storage_state,
         )
-
-        self.page = await context.new_page()
-        logger.info("Browser initialized successfully")
+        return self.context
 
     async def join_meeting(self, meeting_url: str, password: Optional[str] = None) -> bool:
         """
@@ -59,12 +338,19 @@ class MeetJoiner:
         if not self.page:
             await self.initialize()
 
+        # Start from fresh locators for the new navigation
+        self._loc_cache.clear()
+
         try:
             logger.info(f"Navigating to meeting: {meeting_url}")
-            await self.page.goto(meeting_url, wait_until="domcontentloaded")
+            try:
+                # Return as soon as the server responds; _wait_ready below covers the page load
+                await _retry(lambda: self.page.goto(meeting_url, wait_until="commit"))
+            except PlaywrightTimeoutError:
+                logger.warning("Navigation timed out, continuing with the page as loaded so far")
 
             # Wait for page to load
-            await asyncio.sleep(3)
+            await self._wait_ready(timeout=3)
 
             # Try to handle "Continue without an account" if we see a sign-in page
             try:
@@ -76,16 +362,11 @@ class MeetJoiner:
                     "button:has-text('Guest')",
                 ]
 
-                for selector in guest_selectors:
-                    try:
-                        guest_link = self.page.locator(selector).first
-                        if await guest_link.is_visible(timeout=3000):
-                            logger.info("Found guest join option, clicking...")
-                            await guest_link.click()
-                            await asyncio.sleep(2)
-                            break
-                    except:
-                        continue
+                guest_link = await self._first_visible(guest_selectors, timeout=3)
+                if guest_link:
+                    logger.info("Found guest join option, clicking...")
+                    await guest_link.click()
+                    await self._wait_ready(timeout=2)
             except Exception as e:
                 logger.debug(f"Guest join option not found or not needed: {e}")
 
@@ -100,21 +381,13 @@ class MeetJoiner:
                     "input.whsOnd",  # Common Google Meet class for name input
                 ]
 
-                name_entered = False
-                for selector in name_input_selectors:
-                    try:
-                        name_input = self.page.locator(selector).first
-                        if await name_input.is_visible(timeout=3000):
-                            logger.info(f"Entering display name: {self.display_name}")
-                            await name_input.click()
-                            await name_input.fill("")  # Clear any existing text
-                            await name_input.fill(self.display_name)
-                            name_entered = True
-                            break
-                    except:
-                        continue
-
-                if not name_entered:
+                name_input = await self._first_visible(name_input_selectors, timeout=3)
+                if name_input:
+                    logger.info(f"Entering display name: {self.display_name}")
+                    await name_input.click()
+                    await name_input.fill("")  # Clear any existing text
+                    await name_input.fill(self.display_name)
+                else:
                     logger.warning("Could not find name input field")
             except Exception as e:
                 logger.debug(f"Name input handling error: {e}")
@@ -122,7 +395,7 @@ class MeetJoiner:
             # Disable camera and microphone before joining (optional - keeps it muted)
             try:
                 # Look for camera/mic toggle buttons
-                await asyncio.sleep(1)
+                await self._wait_ready(timeout=1)
 
                 # Try to turn off camera
                 camera_selectors = [
@@ -131,17 +404,12 @@ class MeetJoiner:
                     "div[data-tooltip*='camera' i]",
                 ]
 
-                for selector in camera_selectors:
-                    try:
-                        camera_btn = self.page.locator(selector).first
-                        if await camera_btn.is_visible(timeout=2000):
-                            # Check if camera is on (might need to turn off)
-                            await camera_btn.click()
-                            logger.info("Toggled camera")
-                            await asyncio.sleep(0.5)
-                            break
-                    except:
-                        continue
+                camera_btn = await self._first_visible(camera_selectors, timeout=2)
+                if camera_btn:
+                    # Check if camera is on (might need to turn off)
+                    await camera_btn.click()
+                    logger.info("Toggled camera")
+                    await self._wait_ready(timeout=0.5)
             except Exception as e:
                 logger.debug(f"Camera/mic control error: {e}")
 
@@ -156,26 +424,18 @@ class MeetJoiner:
                     "span:has-text('Ask to join')",
                 ]
 
-                join_clicked = False
-                for selector in join_button_selectors:
-                    try:
-                        join_button = self.page.locator(selector).first
-                        if await join_button.is_visible(timeout=3000):
-                            logger.info(f"Clicking join button: {selector}")
-                            await join_button.click()
-                            join_clicked = True
-                            await asyncio.sleep(3)
-                            break
-                    except:
-                        continue
-
-                if not join_clicked:
+                join_button = await self._first_visible(join_button_selectors, timeout=3)
+                if join_button:
+                    logger.info("Clicking join button...")
+                    await _retry(join_button.click)
+                    await self._wait_ready(timeout=3)
+                else:
                     logger.warning("Could not find join button - may already be in meeting")
             except Exception as e:
                 logger.warning(f"Join button click error: {e}")
 
             # Wait for meeting to load
-            await asyncio.sleep(5)
+            await self._wait_ready(timeout=5)
 
             # If "Ask to join" was clicked, wait for host to admit
             # Check for waiting room indicator
@@ -185,18 +445,14 @@ class MeetJoiner:
                     "text=/asked to join/i",
                 ]
 
-                for selector in waiting_indicators:
+                # Optional check once the join click has settled - no indicator means no waiting room
+                if await self._first_visible(waiting_indicators, timeout=2, preflight=True):
+                    logger.info("Waiting for host to admit to meeting...")
+                    # Wait up to 60 seconds for admission, returning as soon as the meeting UI renders
                     try:
-                        waiting_elem = self.page.locator(selector).first
-                        if await waiting_elem.is_visible(timeout=2000):
-                            logger.info("Waiting for host to admit to meeting...")
-                            # Wait up to 60 seconds for admission
-                            for _ in range(12):
-                                await asyncio.sleep(5)
-                                if await self._check_in_meeting():
-                                    break
-                    except:
-                        continue
+                        await self.page.wait_for_selector(self.ADMITTED_SELECTOR, state="visible", timeout=60000)
+                    except PlaywrightTimeoutError:
+                        logger.warning("Not admitted within 60 seconds")
             except Exception as e:
                 logger.debug(f"Waiting room check error: {e}")
 
@@ -215,31 +471,94 @@ class MeetJoiner:
             logger.error(f"Error joining meeting: {e}")
             return False
 
+    def _loc(self, selector: str) -> Locator:
+        """Get the (cached) locator for the first element matching selector"""
+        locator = self._loc_cache.get(selector)
+        if locator is None:
+            locator = self._loc_cache[selector] = self.page.locator(selector).first
+        return locator
+
+    async def _first_visible(
+        self, selectors: List[str], timeout: float, preflight: bool = False
+    ) -> Optional[Locator]:
+        """
+        Race selectors and return the first one to become visible
+
+        Waits concurrently, so a miss costs one timeout rather than one per selector.
+        If several are visible at once, the earliest in `selectors` wins.
+
+        With preflight, selectors that match nothing in the DOM right now are
+        dropped without waiting, and the rest only get a short time to become
+        visible since they have already rendered. Only use it for optional checks
+        of a page that has finished rendering - Meet's pre-join screen renders
+        after load, so probing it this way finds nothing.
+
+        Args:
+            selectors: Candidate selectors, in order of preference
+            timeout: Maximum time to wait in seconds
+            preflight: Skip selectors with no matching element instead of waiting for them
+
+        Returns:
+            Locator for the matching element, or None if none became visible
+        """
+        locators = [self._loc(selector) for selector in selectors]
+
+        if preflight:
+            counts = await asyncio.gather(*(locator.count() for locator in locators), return_exceptions=True)
+            present = [i for i, n in enumerate(counts) if isinstance(n, int) and n > 0]
+            if not present:
+                return None
+            selectors = [selectors[i] for i in present]
+            locators = [locators[i] for i in present]
+            timeout = min(timeout, self.PRESENT_VISIBLE_TIMEOUT)
+
+        tasks = [
+            asyncio.create_task(locator.wait_for(state="visible", timeout=timeout * 1000)) for locator in locators
+        ]
+
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winners = [i for i, task in enumerate(tasks) if task in done and not task.exception()]
+                if winners:
+                    logger.debug(f"Found visible element: {selectors[min(winners)]}")
+                    return locators[min(winners)]
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _wait_ready(self, timeout: float = 10.0) -> bool:
+        """
+        Wait until the page has loaded and its network has gone quiet
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            bool: True if the page became ready before the timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while loop.time() < deadline:
+            try:
+                if await self.page.evaluate("document.readyState") == "complete":
+                    await self.page.wait_for_load_state("networkidle", timeout=500)
+                    return True
+            except Exception:
+                pass
+            await asyncio.sleep(0.1)
+
+        return False
+
     async def _check_in_meeting(self) -> bool:
         """Check if we're currently in a meeting"""
         try:
-            # Look for common Google Meet meeting UI elements
-            indicators = [
-                "button[aria-label*='microphone' i]",
-                "button[aria-label*='Turn off microphone' i]",
-                "button[aria-label*='Turn on microphone' i]",
-                "button[aria-label*='Leave call' i]",
-                "button[aria-label*='End call' i]",
-                "div[data-meeting-title]",
-                "div[data-self-name]",
-                "[data-fps-request-screencast-cap]",
-            ]
-
-            for indicator in indicators:
-                try:
-                    element = self.page.locator(indicator).first
-                    if await element.is_visible(timeout=2000):
-                        logger.debug(f"Found meeting indicator: {indicator}")
-                        return True
-                except:
-                    continue
-
-            return False
+            # Look for any visible Google Meet meeting UI element in one round-trip
+            return bool(await self.page.evaluate(self._IN_MEETING_JS, self.IN_MEETING_SELECTOR))
         except Exception as e:
             logger.debug(f"Error checking meeting status: {e}")
             return False
@@ -253,23 +572,14 @@ class MeetJoiner:
             logger.info("Attempting to leave meeting...")
 
             # Try to find and click the Leave/End call button
-            leave_selectors = [
-                "button[aria-label*='Leave call' i]",
-                "button[aria-label*='End call' i]",
-                "button:has-text('Leave call')",
-                "button:has-text('End call')",
-            ]
-
-            for selector in leave_selectors:
-                try:
-                    leave_button = self.page.locator(selector).first
-                    if await leave_button.is_visible(timeout=3000):
-                        await leave_button.click()
-                        logger.info("Clicked leave button")
-                        await asyncio.sleep(1)
-                        break
-                except:
-                    continue
+            try:
+                leave_button = self._loc(self.LEAVE_SELECTOR)
+                await leave_button.wait_for(state="visible", timeout=3000)
+                await leave_button.click()
+                logger.info("Clicked leave button")
+                await asyncio.sleep(1)
+            except Exception as e:
+                logger.debug(f"Leave button not found: {e}")
 
             self._is_in_meeting = False
             logger.info("Left the meeting")
@@ -278,18 +588,34 @@ class MeetJoiner:
             logger.warning(f"Error leaving meeting: {e}")
 
     async def close(self):
-        """Close browser and cleanup"""
+        """Close this joiner's browser context, and the shared browser once no other joiner uses it"""
         try:
             if self._is_in_meeting:
                 await self.leave_meeting()
 
-            if self.browser:
-                await self.browser.close()
+            if self._playwright:
+                # Persistent profile: the profile itself keeps the state
+                await self.context.close()
+                await self._playwright.stop()
+                self._playwright = None
+                self.context = None
+                self.page = None
+
+            elif self.context:
+                try:
+                    async with _file_lock(Config.MEET_STORAGE_STATE_PATH):
+                        await self.context.storage_state(path=str(Config.MEET_STORAGE_STATE_PATH))
+                except Exception as e:
+                    logger.warning(f"Could not save browser state: {e}")
+
+                await self.context.close()
+                self.context = None
+                self.page = None
 
-            if self.playwright:
-                await self.playwright.stop()
+                await release_shared_browser(self.browser)
+            self.browser = None
 
-            logger.info("Browser closed")
+            logger.info("Browser context closed")
 
         except Exception as e:
             logger.error(f"Error closing browser: {e}")
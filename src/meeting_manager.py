@@ -2,15 +2,25 @@
 Main meeting manager that orchestrates all components
 """
 import asyncio
+import json
 import logging
-from typing import Optional, Callable, Dict, Any
+import time
+from typing import Optional, Callable, Dict, Any, List
 from datetime import datetime, timedelta
 from .meet_joiner import MeetJoiner
 from .audio_capture import AudioCapturer
 from .transcription import TranscriptionManager
 from .summarizer import MeetingSummarizer
+from .status import Status
 from .config import Config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_now = datetime.now
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,11 +62,24 @@ class MeetingAssistant:
         # State
         self.is_running = False
         self.meeting_start_time: Optional[datetime] = None
-        self.last_summary_time: Optional[datetime] = None
+        self.last_summary_time: Optional[float] = None  # time.monotonic() of the last summary
 
         # Tasks
         self._audio_task: Optional[asyncio.Task] = None
+        self._audio_reader: Optional[asyncio.Future] = None
         self._summary_task: Optional[asyncio.Task] = None
+        self._summary_wakeup = asyncio.Event()  # Set when the meeting stops or enough new transcript arrives
+        self._chars_since_summary = 0
+
+        # Audio chunks handed from the capture reader thread to the event loop
+        self._audio_queue: Optional[asyncio.Queue] = None
+
+        # Text deltas of the summary currently being generated (None when idle)
+        self._summary_buffer: Optional[List[str]] = None
+
+        # Full transcript, rebuilt only after a new final segment arrives
+        self._transcript_cache: Optional[str] = None
+        self._transcript_dirty = True
 
         # Stats
         self.stats = {
@@ -65,44 +88,44 @@ class MeetingAssistant:
             "errors": 0,
         }
 
-    def _update_status(self, status: str, details: Optional[str] = None):
+    def _update_status(self, status: Status, details: Optional[str] = None):
         """Update and broadcast status"""
-        logger.info(f"Status: {status}" + (f" - {details}" if details else ""))
+        logger.info(f"Status: {status.name.lower()}" + (f" - {details}" if details else ""))
 
         if self.on_status_change:
-            self.on_status_change({"status": status, "details": details, "timestamp": datetime.now().isoformat()})
+            # Epoch seconds; consumers format it only if they display it
+            self.on_status_change({"status": status, "details": details, "timestamp": time.time()})
 
     async def initialize(self):
         """Initialize all components"""
         try:
-            self._update_status("initializing", "Setting up components...")
+            self._update_status(Status.INITIALIZING, "Setting up components...")
 
             # Validate configuration
             Config.validate()
 
-            # Initialize transcription manager
-            self._update_status("initializing", "Setting up transcription service...")
-            self.transcription_manager = TranscriptionManager(on_transcript=self._handle_transcript)
-            await self.transcription_manager.initialize()
-
             # Initialize summarizer
-            self._update_status("initializing", "Setting up AI summarizer...")
-            self.summarizer = MeetingSummarizer(on_summary=self._handle_summary)
+            self._update_status(Status.INITIALIZING, "Setting up AI summarizer...")
+            self.summarizer = MeetingSummarizer(on_summary=self._handle_summary, on_delta=self._handle_summary_delta)
 
-            # Initialize Google Meet joiner
-            self._update_status("initializing", "Setting up Google Meet integration...")
+            # Initialize transcription manager and Google Meet joiner concurrently, warming up
+            # the Claude connection meanwhile - the connections and the browser launch are independent
+            self._update_status(Status.INITIALIZING, "Setting up transcription service and Google Meet integration...")
+            self.transcription_manager = TranscriptionManager(on_transcript=self._handle_transcript)
             self.meet_joiner = MeetJoiner()
-            await self.meet_joiner.initialize()
+            await asyncio.gather(
+                self.transcription_manager.initialize(), self.meet_joiner.initialize(), self.summarizer.warmup()
+            )
 
             # Initialize audio capturer
-            self._update_status("initializing", "Setting up audio capture...")
+            self._update_status(Status.INITIALIZING, "Setting up audio capture...")
             self.audio_capturer = AudioCapturer()
 
-            self._update_status("ready", "All components initialized")
+            self._update_status(Status.READY, "All components initialized")
             logger.info("Meeting assistant initialized successfully")
 
         except Exception as e:
-            self._update_status("error", f"Initialization failed: {e}")
+            self._update_status(Status.ERROR, f"Initialization failed: {e}")
             logger.error(f"Error initializing meeting assistant: {e}")
             raise
 
@@ -122,89 +145,130 @@ class MeetingAssistant:
             return
 
         try:
-            self._update_status("joining", "Joining Google Meet meeting...")
+            self._update_status(Status.JOINING, "Joining Google Meet meeting...")
 
             # Join Google Meet meeting
             success = await self.meet_joiner.join_meeting(meeting_url, password)
 
             if not success:
-                self._update_status("error", "Failed to join meeting")
+                self._update_status(Status.ERROR, "Failed to join meeting")
                 return
 
-            self._update_status("in_meeting", "Successfully joined meeting")
+            self._update_status(Status.IN_MEETING, "Successfully joined meeting")
             self.is_running = True
-            self.meeting_start_time = datetime.now()
-            self.last_summary_time = datetime.now()
+            self.meeting_start_time = _now()
+            self.last_summary_time = time.monotonic()
+            self._summary_wakeup.clear()
+            self._chars_since_summary = 0
 
             # Start audio capture
-            self._update_status("in_meeting", "Starting audio capture...")
+            self._update_status(Status.IN_MEETING, "Starting audio capture...")
             self.audio_capturer.start_capture(device_id=audio_device_id)
 
+            # Read audio on a worker thread so blocking waits never stall the event loop
+            loop = asyncio.get_running_loop()
+            self._audio_queue = asyncio.Queue()
+            self._audio_reader = loop.run_in_executor(None, self._read_audio_blocking, loop)
+
             # Start audio processing loop
             self._audio_task = asyncio.create_task(self._audio_processing_loop())
 
             # Start summary generation loop
             self._summary_task = asyncio.create_task(self._summary_loop())
 
-            self._update_status("recording", "Recording and transcribing meeting...")
+            self._update_status(Status.RECORDING, "Recording and transcribing meeting...")
             logger.info("Meeting started successfully")
 
         except Exception as e:
-            self._update_status("error", f"Error starting meeting: {e}")
+            self._update_status(Status.ERROR, f"Error starting meeting: {e}")
             logger.error(f"Error starting meeting: {e}")
             self.stats["errors"] += 1
             raise
 
+    def _read_audio_blocking(self, loop: asyncio.AbstractEventLoop):
+        """Pull audio chunks from the capturer (runs on an executor thread)"""
+        while self.is_running:
+            audio_chunk = self.audio_capturer.get_audio_chunk(timeout=0.5)
+
+            if audio_chunk is not None:
+                loop.call_soon_threadsafe(self._audio_queue.put_nowait, audio_chunk)
+
     async def _audio_processing_loop(self):
         """Process audio and send to transcription"""
         logger.info("Starting audio processing loop...")
 
+        loop = asyncio.get_running_loop()
+        batch = []
+        flush_at = 0.0
+
         try:
             while self.is_running:
-                # Get audio chunk from capturer
-                audio_chunk = self.audio_capturer.get_audio_chunk(timeout=0.5)
-
-                if audio_chunk is not None:
-                    # Send to transcription service
-                    await self.transcription_manager.transcribe_audio(audio_chunk)
+                # Get audio chunk from the reader thread, waking up in time to flush a partial batch
+                timeout = max(flush_at - loop.time(), 0) if batch else None
+                try:
+                    audio_chunk = await asyncio.wait_for(self._audio_queue.get(), timeout)
+                    if not batch:
+                        flush_at = loop.time() + Config.TRANSCRIBE_FLUSH_SECONDS
+                    batch.append(audio_chunk)
+                except asyncio.TimeoutError:
+                    pass
 
-                await asyncio.sleep(0.01)  # Small delay to prevent busy waiting
+                # Send to transcription service in batches
+                if len(batch) >= Config.TRANSCRIBE_BATCH or (batch and loop.time() >= flush_at):
+                    await self.transcription_manager.transcribe_audio(b"".join(batch))
+                    batch.clear()
 
         except Exception as e:
             logger.error(f"Error in audio processing loop: {e}")
             self.stats["errors"] += 1
-            self._update_status("error", f"Audio processing error: {e}")
+            self._update_status(Status.ERROR, f"Audio processing error: {e}")
 
     async def _summary_loop(self):
         """Generate summaries at regular intervals"""
         logger.info("Starting summary generation loop...")
 
-        interval = timedelta(minutes=Config.SUMMARY_INTERVAL_MINUTES)
+        interval = timedelta(minutes=Config.SUMMARY_INTERVAL_MINUTES).total_seconds()
 
         try:
             while self.is_running:
-                await asyncio.sleep(10)  # Check every 10 seconds
+                # Sleep until the interval elapses, waking early if the meeting stops
+                # or SUMMARY_CHAR_THRESHOLD characters of new transcript arrive
+                remaining = interval - (time.monotonic() - self.last_summary_time)
+                try:
+                    await asyncio.wait_for(self._summary_wakeup.wait(), timeout=max(remaining, 0))
+                except asyncio.TimeoutError:
+                    pass
+                self._summary_wakeup.clear()
 
-                if not self.last_summary_time:
-                    continue
+                if not self.is_running:
+                    break
 
-                time_since_last = datetime.now() - self.last_summary_time
+                if self._chars_since_summary < 50:
+                    # Quiet meeting - nothing new worth an LLM call, wait another interval
+                    logger.info("Not enough new transcript since last summary, skipping")
+                    self.last_summary_time = time.monotonic()
+                    continue
 
-                if time_since_last >= interval:
-                    # Time to generate a summary
-                    await self._generate_summary()
-                    self.last_summary_time = datetime.now()
+                # Time to generate a summary
+                self._chars_since_summary = 0
+                await self._generate_summary()
+                self.last_summary_time = time.monotonic()
 
         except Exception as e:
             logger.error(f"Error in summary loop: {e}")
             self.stats["errors"] += 1
-            self._update_status("error", f"Summary generation error: {e}")
+            self._update_status(Status.ERROR, f"Summary generation error: {e}")
 
-    async def _generate_summary(self):
-        """Generate a summary of recent transcript"""
+    async def _generate_summary(self, final: bool = False):
+        """
+        Generate a summary of recent transcript
+
+        Args:
+            final: This is the last summary of the meeting (skips condensing its context)
+        """
         try:
             logger.info("Generating summary...")
-            self._update_status("recording", "Generating summary...")
+            self._update_status(Status.RECORDING, "Generating summary...")
 
             # Get recent transcript
             transcript = self.transcription_manager.get_recent_transcript(minutes=Config.SUMMARY_INTERVAL_MINUTES)
@@ -216,8 +280,12 @@ class MeetingAssistant:
             # Get context from previous summaries
             context = self.summarizer.get_context_for_next_summary(num_previous=2)
 
-            # Generate summary
-            summary = await self.summarizer.generate_summary(transcript, context)
+            # Generate summary, exposing its text so far through summary_in_progress meanwhile
+            self._summary_buffer = []
+            try:
+                summary = await self.summarizer.generate_summary(transcript, context, condense=not final)
+            finally:
+                self._summary_buffer = None
 
             self.stats["summaries_generated"] += 1
             logger.info(f"Summary generated (total: {self.stats['summaries_generated']})")
@@ -227,9 +295,22 @@ class MeetingAssistant:
             self.stats["errors"] += 1
 
     def _handle_transcript(self, transcript_result: Dict[str, Any]):
-        """Handle new transcript from transcription service"""
+        """
+        Handle new transcript from transcription service
+
+        Runs on the event loop: TranscriptionManager hands results over from the SDK
+        threads through its queue consumer, so no locking or thread hand-off is needed here.
+        """
         self.stats["transcripts_received"] += 1
 
+        if transcript_result.get("is_final"):
+            self._transcript_dirty = True
+
+            # Wake the summary loop early once enough new speech has built up
+            self._chars_since_summary += len(transcript_result.get("text", ""))
+            if self._chars_since_summary >= Config.SUMMARY_CHAR_THRESHOLD:
+                self._summary_wakeup.set()
+
         if self.on_transcript:
             self.on_transcript(transcript_result)
 
@@ -238,13 +319,35 @@ class MeetingAssistant:
         if self.on_summary:
             self.on_summary(summary)
 
+    def _handle_summary_delta(self, payload: Dict[str, Any]):
+        """Handle a partial summary payload streamed from summarizer"""
+        # Only raw text deltas are buffered; parsed section events are skipped
+        buffer = self._summary_buffer
+        if buffer is not None and "delta" in payload:
+            buffer.append(payload["delta"])
+
+    @property
+    def is_summarizing(self) -> bool:
+        """Check if a summary is currently being generated"""
+        return self._summary_buffer is not None
+
+    @property
+    def summary_in_progress(self) -> str:
+        """
+        Text of the summary currently being generated, as streamed so far
+
+        Safe to read from another thread (e.g. a UI polling on rerun); empty when idle.
+        """
+        buffer = self._summary_buffer
+        return "".join(buffer) if buffer else ""
+
     async def stop_meeting(self):
         """Stop the meeting and cleanup"""
         if not self.is_running:
             return
 
         try:
-            self._update_status("stopping", "Stopping meeting...")
+            self._update_status(Status.STOPPING, "Stopping meeting...")
             self.is_running = False
 
             # Cancel tasks
@@ -255,30 +358,31 @@ class MeetingAssistant:
                 except asyncio.CancelledError:
                     pass
 
+            # Wake the summary loop so it exits; a summary already in flight is allowed to finish
+            self._summary_wakeup.set()
             if self._summary_task:
-                self._summary_task.cancel()
-                try:
-                    await self._summary_task
-                except asyncio.CancelledError:
-                    pass
+                await self._summary_task
+
+            # The reader thread exits within one get_audio_chunk timeout of is_running going False
+            if self._audio_reader:
+                await self._audio_reader
 
             # Generate final summary
-            self._update_status("stopping", "Generating final summary...")
-            await self._generate_summary()
+            self._update_status(Status.STOPPING, "Generating final summary...")
+            await self._generate_summary(final=True)
 
             # Stop audio capture
             if self.audio_capturer:
                 self.audio_capturer.stop_capture()
 
-            # Stop transcription
-            if self.transcription_manager:
-                await self.transcription_manager.stop()
-
-            # Leave Google Meet meeting
-            if self.meet_joiner:
-                await self.meet_joiner.leave_meeting()
+            # Closing the transcription socket and leaving the call are independent
+            # network round-trips, so run them concurrently
+            await self._run_teardown(
+                self.transcription_manager.stop() if self.transcription_manager else None,
+                self.meet_joiner.leave_meeting() if self.meet_joiner else None,
+            )
 
-            self._update_status("stopped", "Meeting ended")
+            self._update_status(Status.STOPPED, "Meeting ended")
             logger.info("Meeting stopped successfully")
 
             # Log stats
@@ -288,17 +392,37 @@ class MeetingAssistant:
             logger.error(f"Error stopping meeting: {e}")
             self.stats["errors"] += 1
 
+    async def _run_teardown(self, *coros):
+        """
+        Run teardown coroutines concurrently, letting each finish even if another fails
+
+        Failures are logged and counted rather than raised, so one failing step
+        (e.g. closing the transcription socket) never cancels another (leaving the call).
+
+        Args:
+            *coros: Coroutines to run; None entries are skipped
+        """
+        coros = [c for c in coros if c is not None]
+        if not coros:
+            return
+
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error during teardown: {result}")
+                self.stats["errors"] += 1
+
     async def cleanup(self):
         """Full cleanup of all resources"""
         try:
             if self.is_running:
                 await self.stop_meeting()
 
-            # Close browser
+            # Close the browser context (and the shared browser, once nothing else uses it)
             if self.meet_joiner:
                 await self.meet_joiner.close()
 
-            self._update_status("closed", "All resources cleaned up")
+            self._update_status(Status.CLOSED, "All resources cleaned up")
             logger.info("Cleanup completed")
 
         except Exception as e:
@@ -306,9 +430,13 @@ class MeetingAssistant:
 
     def get_full_transcript(self) -> str:
         """Get the complete meeting transcript"""
-        if self.transcription_manager:
-            return self.transcription_manager.get_full_transcript()
-        return ""
+        if not self.transcription_manager:
+            return ""
+
+        if self._transcript_dirty or self._transcript_cache is None:
+            self._transcript_cache = self.transcription_manager.get_full_transcript()
+            self._transcript_dirty = False
+        return self._transcript_cache
 
     def get_all_summaries(self):
         """Get all generated summaries"""
@@ -316,64 +444,67 @@ class MeetingAssistant:
             return self.summarizer.get_all_summaries()
         return []
 
-    def export_meeting(self, format: str = "markdown") -> str:
+    def export_meeting(self, format: str = "markdown", pretty: bool = True) -> str:
         """
         Export complete meeting data
 
         Args:
             format: Export format ('markdown', 'json', or 'text')
+            pretty: Indent JSON output (pass False for compact JSON)
 
         Returns:
             Formatted export string
         """
+        transcript = self.get_full_transcript()
+        started = self.meeting_start_time.strftime("%Y-%m-%d %H:%M:%S") if self.meeting_start_time else None
+
         if format == "json":
-            import json
-
-            return json.dumps(
-                {
-                    "meeting_start": self.meeting_start_time.isoformat() if self.meeting_start_time else None,
-                    "transcript": self.get_full_transcript(),
-                    "summaries": self.get_all_summaries(),
-                    "stats": self.stats,
-                },
-                indent=2,
-            )
+            data = {
+                "meeting_start": self.meeting_start_time.isoformat() if self.meeting_start_time else None,
+                "transcript": transcript,
+                "summaries": self.get_all_summaries(),
+                "stats": self.stats,
+            }
+
+            if orjson:
+                option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+                return orjson.dumps(data, option=option).decode()
+            if pretty:
+                return json.dumps(data, indent=2)
+            return json.dumps(data, separators=(",", ":"))
 
         elif format == "markdown":
-            output = "# Meeting Recording\n\n"
+            parts = ["# Meeting Recording\n\n"]
 
-            if self.meeting_start_time:
-                output += f"**Started:** {self.meeting_start_time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            if started:
+                parts.append(f"**Started:** {started}\n\n")
 
-            output += "## Full Transcript\n\n"
-            output += self.get_full_transcript() + "\n\n"
-            output += "---\n\n"
+            parts += ["## Full Transcript\n\n", transcript, "\n\n", "---\n\n"]
 
             if self.summarizer:
-                output += self.summarizer.export_summaries(format="markdown")
+                parts.append(self.summarizer.export_summaries(format="markdown"))
 
-            output += f"\n## Stats\n\n"
-            output += f"- Transcripts received: {self.stats['transcripts_received']}\n"
-            output += f"- Summaries generated: {self.stats['summaries_generated']}\n"
-            output += f"- Errors: {self.stats['errors']}\n"
+            parts += [
+                "\n## Stats\n\n",
+                f"- Transcripts received: {self.stats['transcripts_received']}\n",
+                f"- Summaries generated: {self.stats['summaries_generated']}\n",
+                f"- Errors: {self.stats['errors']}\n",
+            ]
 
-            return output
+            return "".join(parts)
 
         else:  # text
-            output = "MEETING RECORDING\n"
-            output += "=" * 70 + "\n\n"
+            parts = ["MEETING RECORDING\n", "=" * 70, "\n\n"]
 
-            if self.meeting_start_time:
-                output += f"Started: {self.meeting_start_time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            if started:
+                parts.append(f"Started: {started}\n\n")
 
-            output += "TRANSCRIPT:\n"
-            output += "-" * 70 + "\n"
-            output += self.get_full_transcript() + "\n\n"
+            parts += ["TRANSCRIPT:\n", "-" * 70, "\n", transcript, "\n\n"]
 
             if self.summarizer:
-                output += self.summarizer.export_summaries(format="text")
+                parts.append(self.summarizer.export_summaries(format="text"))
 
-            return output
+            return "".join(parts)
 
     def list_audio_devices(self):
         """List available audio devices"""
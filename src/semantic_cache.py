@@ -0,0 +1,82 @@
+"""
+Near-duplicate lookup of earlier summaries by transcript similarity
+"""
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+import numpy as np
+
+_PRIME = (1 << 31) - 1  # Keeps a * hash + b within uint64 for 32-bit hashes
+
+
+class SummaryCache:
+    """
+    Reuse a summary when a new transcript is nearly identical to one already summarized
+
+    Transcripts are compared by MinHash signatures over word shingles, whose
+    agreement estimates the Jaccard similarity of the two shingle sets. A transcript
+    that extends a cached one (a live meeting that kept going) is never a hit, however
+    similar: its newly spoken part has not been summarized yet.
+    """
+
+    def __init__(self, threshold: float = 0.92, num_perm: int = 64, shingle: int = 3, max_entries: int = 32):
+        """
+        Args:
+            threshold: Minimum estimated similarity for a hit
+            num_perm: Signature length (more is more accurate and slower)
+            shingle: Words per shingle
+            max_entries: Oldest entries are dropped beyond this
+        """
+        self.threshold = threshold
+        self.shingle = shingle
+        self._entries: Deque[Tuple[np.ndarray, str, Dict[str, Any]]] = deque(maxlen=max_entries)
+
+        rng = np.random.default_rng(0)
+        self._a = rng.integers(1, _PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=(num_perm, 1), dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a text
+
+        Args:
+            text: Text to fingerprint
+
+        Returns:
+            Signature array of length num_perm
+        """
+        words = text.lower().split()
+        n = self.shingle
+        shingles = {" ".join(words[i : i + n]) for i in range(max(len(words) - n + 1, 1))}
+        hashes = np.fromiter((hash(s) & 0xFFFFFFFF for s in shingles), dtype=np.uint64, count=len(shingles))
+        return ((self._a * hashes + self._b) % _PRIME).min(axis=1)
+
+    def lookup(self, text: str) -> Tuple[Optional[Dict[str, Any]], np.ndarray]:
+        """
+        Find the cached summary most similar to text
+
+        Args:
+            text: Transcript about to be summarized
+
+        Returns:
+            (summary or None if nothing clears the threshold, signature of text for store())
+        """
+        sig = self.signature(text)
+        best, best_score = None, self.threshold
+        for cached_sig, cached_text, summary in self._entries:
+            if len(text) > len(cached_text) and text.startswith(cached_text):
+                continue
+            score = float(np.mean(cached_sig == sig))
+            if score >= best_score:
+                best, best_score = summary, score
+        return best, sig
+
+    def store(self, sig: np.ndarray, text: str, summary: Dict[str, Any]):
+        """
+        Remember a summary under a transcript signature
+
+        Args:
+            sig: Signature returned by lookup()
+            text: Transcript that was summarized
+            summary: Summary generated for that transcript
+        """
+        self._entries.append((sig, text, summary))
@@ -0,0 +1,28 @@
+"""
+Meeting assistant status values
+"""
+from enum import IntEnum
+
+
+class Status(IntEnum):
+    """
+    Lifecycle status broadcast through MeetingAssistant.on_status_change
+
+    Values are dense from 0 so UIs can dispatch with a plain list indexed by status.
+    """
+
+    NOT_INITIALIZED = 0
+    READY = 1
+    RECORDING = 2
+    IN_MEETING = 3
+    ERROR = 4
+    STOPPED = 5
+    INITIALIZING = 6
+    JOINING = 7
+    STOPPING = 8
+    CLOSED = 9
+
+    @property
+    def label(self) -> str:
+        """Human-readable name, e.g. "IN MEETING" """
+        return self.name.replace("_", " ")
@@ -2,33 +2,185 @@
 AI-powered meeting summarization using Claude
 """
 import asyncio
+import hashlib
+import json
 import logging
-from typing import Optional, Callable, Dict, Any, List
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Callable, Dict, Any, List, Tuple, Union
 from datetime import datetime
-from anthropic import Anthropic, AsyncAnthropic
+import httpx
+from anthropic import AsyncAnthropic, BadRequestError
+from anthropic.types import Message
 from .config import Config
+from .semantic_cache import SummaryCache
+from .summary_parser import IncrementalSummaryParser, parse_summary
+from .summary_view import iter_sections
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from ._parse import parse_summary as _compiled_parse_summary
+except ImportError:
+    _compiled_parse_summary = None
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+except ImportError:
+    h2 = None
 
 logger = logging.getLogger(__name__)
 
+# HTTP clients shared by all summarizers, one per event loop (httpx connections are loop-bound).
+# Weakly keyed, so this registry never keeps a discarded loop (or its client) alive;
+# shutdown_shared_http_client() closes the current loop's client explicitly
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the HTTP client for Claude requests on the current event loop
+
+    Reusing one connection pool (multiplexed over HTTP/2 when h2 is installed)
+    saves a TCP/TLS handshake per summarizer and per concurrent window request.
+
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    client = _http_clients.get(loop) if loop is not None else None
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=h2 is not None,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        )
+        if loop is not None:
+            _http_clients[loop] = client
+    return client
+
+
+async def shutdown_shared_http_client():
+    """Close the shared HTTP client created on the current event loop"""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.error(f"Error closing HTTP client: {e}")
+
 
 class MeetingSummarizer:
     """Generates AI-powered meeting summaries using Claude"""
 
-    def __init__(self, on_summary: Optional[Callable] = None):
+    # Instructions shared by every summary request (the cached prompt prefix)
+    SUMMARY_PROMPT = """Analyze the following meeting transcript segment and provide a structured summary.
+
+Format your response as follows:
+
+## Key Discussion Points
+- [List main topics discussed with brief descriptions]
+
+## Decisions Made
+- [List any decisions or conclusions reached]
+
+## Action Items
+- [List action items with owners if mentioned, e.g., "John to review the proposal by Friday"]
+
+## Important Questions/Concerns
+- [List significant questions raised or concerns expressed]
+
+## Overall Summary
+[Provide a brief 2-3 sentence overview of this segment]
+
+Keep the summary concise, factual, and well-organized. Focus on actionable information and key takeaways."""
+
+    # Folds older summaries into the running context (see _maybe_condense)
+    CONDENSE_PROMPT = (
+        "Merge these meeting summaries into a single paragraph of at most 150 words, in chronological order. "
+        "Keep decisions, owners of action items and unresolved questions; drop repetition."
+    )
+
+    # Map step for long transcripts; the notes feed the regular summary prompt
+    WINDOW_PROMPT = (
+        "Condense this excerpt of a meeting transcript into concise bullet points. "
+        "Keep every topic, decision, action item (with owner) and open question; drop small talk."
+    )
+
+    __slots__ = (
+        "client",
+        "on_summary",
+        "on_delta",
+        "summaries",
+        "_window_semaphore",
+        "_cache",
+        "_token_counts",
+        "_window_notes",
+        "_latency_optimized",
+        "condensed_context",
+        "_condensed_upto",
+    )
+
+    def __init__(self, on_summary: Optional[Callable] = None, on_delta: Optional[Callable] = None):
+        """
+        Args:
+            on_summary: Called with each finished summary dict ("partial": False)
+            on_delta: Called with {"partial": True, "delta": text} for each streamed text chunk,
+                and with {"partial": True, "section": name, "item": text} for each parsed line
+        """
         if not Config.ANTHROPIC_API_KEY:
             raise ValueError("ANTHROPIC_API_KEY not set in environment")
 
-        self.client = AsyncAnthropic(api_key=Config.ANTHROPIC_API_KEY)
+        self.client = AsyncAnthropic(api_key=Config.ANTHROPIC_API_KEY, http_client=_shared_http_client())
         self.on_summary = on_summary
+        self.on_delta = on_delta
         self.summaries: List[Dict[str, Any]] = []
+        # Very high concurrency on one pool tends to surface as APIConnectionError, so cap it
+        self._window_semaphore = asyncio.Semaphore(min(Config.SUMMARY_MAX_CONCURRENCY, 8))
+        self._cache = SummaryCache(threshold=Config.SUMMARY_CACHE_SIMILARITY)
+        self._token_counts: "OrderedDict[bytes, int]" = OrderedDict()  # Text digest -> input tokens
+        self._window_notes: "OrderedDict[bytes, str]" = OrderedDict()  # Window digest -> map-step notes
+        self._latency_optimized = Config.CLAUDE_LATENCY_MODE == "optimized"
+
+        # Older summaries folded into one paragraph, so prompt context stays bounded
+        self.condensed_context = ""
+        self._condensed_upto = 0  # self.summaries[:_condensed_upto] are covered by condensed_context
+
+    async def warmup(self):
+        """
+        Open the connection to the Claude API ahead of the first summary
+
+        Fetches the configured model's metadata (no tokens used), so the TCP/TLS
+        handshake happens during startup rather than on the first summary.
+        Failures are logged and ignored - the first real request simply pays the cost.
+        """
+        try:
+            await self.client.models.retrieve(Config.CLAUDE_MODEL)
+            logger.info("Claude API connection warmed up")
+        except Exception as e:
+            logger.debug(f"Claude warmup failed: {e}")
 
-    async def generate_summary(self, transcript: str, context: Optional[str] = None) -> Dict[str, Any]:
+    async def generate_summary(
+        self, transcript: str, context: Optional[str] = None, condense: bool = True
+    ) -> Dict[str, Any]:
         """
         Generate a structured summary from transcript
 
         Args:
             transcript: The transcript text to summarize
             context: Optional context from previous summaries
+            condense: Fold older summaries into condensed_context afterwards
+                (pass False for a final summary, whose context is never used again)
 
         Returns:
             Dictionary containing the summary
@@ -45,38 +197,59 @@ class MeetingSummarizer:
             }
 
         try:
+            # A near-duplicate of an earlier transcript (recaps, re-joins) reuses its summary;
+            # a transcript that merely grew since an earlier summary is never treated as one
+            cached, signature = self._cache.lookup(transcript)
+            if cached is not None:
+                logger.info("Transcript matches a previous one, reusing its summary")
+                summary = {**cached, "timestamp": datetime.now().isoformat(), "raw_transcript": transcript, "cached": True}
+                self.summaries.append(summary)
+                if self.on_summary:
+                    self.on_summary(summary)
+                if condense:
+                    await self._maybe_condense()
+                return summary
+
             logger.info("Generating summary with Claude...")
 
-            # Build the prompt
-            prompt = self._build_summary_prompt(transcript, context)
+            # Long transcripts are mapped to per-window notes first, so each call stays bounded
+            windows = self._split_windows(transcript, Config.SUMMARY_WINDOW_WORDS, Config.SUMMARY_WINDOW_OVERLAP)
+            if len(windows) == 1 and not await self._fits_input_budget(transcript, context):
+                # Short in words but too many tokens for one request (e.g. a raised SUMMARY_WINDOW_WORDS)
+                windows = self._split_windows(transcript, 1024, Config.SUMMARY_WINDOW_OVERLAP)
+            if len(windows) > 1:
+                logger.info(f"Summarizing {len(windows)} transcript windows...")
+                notes = await asyncio.gather(*[self._summarize_window(window) for window in windows])
+                source = "\n\n".join(f"[Part {i}]\n{note}" for i, note in enumerate(notes, 1))
+            else:
+                source = transcript
 
-            # Call Claude API
-            response = await self.client.messages.create(
-                model=Config.CLAUDE_MODEL,
-                max_tokens=1500,
-                temperature=0.3,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            # Build the prompt
+            prompt = self._build_summary_prompt(source, context)
 
-            # Parse response
-            summary_text = response.content[0].text
+            # Call Claude API, parsing text deltas as they arrive
+            summary_text, parsed = await self._stream_summary(prompt)
 
             # Create structured summary
             summary = {
+                "partial": False,
                 "timestamp": datetime.now().isoformat(),
                 "summary": summary_text,
                 "raw_transcript": transcript,
-                "parsed": self._parse_summary(summary_text),
+                "parsed": parsed,
             }
 
             # Store summary
             self.summaries.append(summary)
+            self._cache.store(signature, transcript, summary)
 
             # Call callback if provided
             if self.on_summary:
                 self.on_summary(summary)
 
             logger.info("Summary generated successfully")
+            if condense:
+                await self._maybe_condense()
             return summary
 
         except Exception as e:
@@ -87,45 +260,310 @@ class MeetingSummarizer:
                 "error": str(e),
             }
 
-    def _build_summary_prompt(self, transcript: str, context: Optional[str] = None) -> str:
-        """Build the prompt for Claude"""
+    async def _stream_summary(self, prompt: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Stream a summary from Claude, forwarding text deltas and parsed lines to on_delta
 
-        base_prompt = """Analyze the following meeting transcript segment and provide a structured summary.
+        Args:
+            prompt: Content blocks from _build_summary_prompt
 
-Format your response as follows:
+        Returns:
+            (complete response text, parsed sections)
+        """
+        kwargs = dict(
+            model=Config.CLAUDE_MODEL,
+            max_tokens=1500,
+            temperature=0.3,
+            messages=[{"role": "user", "content": prompt}],
+        )
+
+        # Parse mid-stream when someone consumes the section events, or when there is no
+        # compiled parser to do the final parse faster; otherwise parse once at the end
+        chunks = []
+        parser = None
+        if self.on_delta or _compiled_parse_summary is None:
+            parser = IncrementalSummaryParser(self._emit_section if self.on_delta else None)
+        try:
+            async with self.client.messages.stream(**kwargs, **self._latency_kwargs()) as stream:
+                async for event in stream:
+                    if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                        chunks.append(event.delta.text)
+                        if self.on_delta:
+                            self.on_delta({"partial": True, "delta": event.delta.text})
+                        if parser:
+                            parser.feed(event.delta.text)
+
+                await stream.get_final_message()
+        except BadRequestError as e:
+            # Rejected before any output: retry without the latency option
+            if not self._latency_optimized or chunks:
+                raise
+            self._disable_latency_mode(e)
+            return await self._stream_summary(prompt)
+
+        text = "".join(chunks)
+        return text, parser.finalize() if parser else self._parse_summary(text)
+
+    def _emit_section(self, section: str, item: str):
+        """Forward a line parsed mid-stream to on_delta"""
+        self.on_delta({"partial": True, "section": section, "item": item})
+
+    async def _create(self, **kwargs) -> Message:
+        """
+        Call messages.create, with the optimized latency option if enabled
 
-## Key Discussion Points
-- [List main topics discussed with brief descriptions]
+        Args:
+            **kwargs: Arguments for messages.create
 
-## Decisions Made
-- [List any decisions or conclusions reached]
+        Returns:
+            The response message
+        """
+        if self._latency_optimized:
+            try:
+                return await self.client.messages.create(**kwargs, **self._latency_kwargs())
+            except BadRequestError as e:
+                self._disable_latency_mode(e)
+        return await self.client.messages.create(**kwargs)
+
+    def _latency_kwargs(self) -> Dict[str, Any]:
+        """Extra request arguments selecting Config.CLAUDE_LATENCY_MODE"""
+        if not self._latency_optimized:
+            return {}
+        return {"extra_body": {"performance_config": {"latency": Config.CLAUDE_LATENCY_MODE}}}
+
+    def _disable_latency_mode(self, error: Exception):
+        """Stop requesting the latency option after the API rejects it"""
+        logger.warning(f"Latency mode '{Config.CLAUDE_LATENCY_MODE}' not supported, falling back to standard: {error}")
+        self._latency_optimized = False
+
+    async def generate_summaries_batch(self, transcripts: List[str], poll_interval: float = 5.0) -> List[Dict[str, Any]]:
+        """
+        Summarize many transcripts through the Message Batches API
 
-## Action Items
-- [List action items with owners if mentioned, e.g., "John to review the proposal by Friday"]
+        For offline work (re-summarizing past meetings, bulk exports) where latency
+        doesn't matter: batches cost about half as much as regular calls. Results are
+        appended to self.summaries in input order; on_summary is not called.
 
-## Important Questions/Concerns
-- [List significant questions raised or concerns expressed]
+        Args:
+            transcripts: Transcripts to summarize
+            poll_interval: Initial seconds between status checks (backs off to 60s)
 
-## Overall Summary
-[Provide a brief 2-3 sentence overview of this segment]
+        Returns:
+            One summary dict per transcript, in input order
+        """
+        if not transcripts:
+            return []
+
+        requests = [
+            {
+                "custom_id": f"transcript-{i}",
+                "params": {
+                    "model": Config.CLAUDE_MODEL,
+                    "max_tokens": 1500,
+                    "temperature": 0.3,
+                    "messages": [{"role": "user", "content": self._build_summary_prompt(transcript)}],
+                },
+            }
+            for i, transcript in enumerate(transcripts)
+        ]
+
+        batch = await self.client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted summary batch {batch.id} ({len(requests)} transcripts)")
+
+        delay = poll_interval
+        while batch.processing_status != "ended":
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+
+        texts: Dict[str, str] = {}
+        errors: Dict[str, str] = {}
+        async for entry in await self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                texts[entry.custom_id] = entry.result.message.content[0].text
+            else:
+                errors[entry.custom_id] = entry.result.type
+
+        summaries = []
+        for i, transcript in enumerate(transcripts):
+            custom_id = f"transcript-{i}"
+            if custom_id in texts:
+                summary = {
+                    "partial": False,
+                    "timestamp": datetime.now().isoformat(),
+                    "summary": texts[custom_id],
+                    "raw_transcript": transcript,
+                    "parsed": self._parse_summary(texts[custom_id]),
+                }
+                self.summaries.append(summary)
+            else:
+                error = errors.get(custom_id, "missing")
+                logger.error(f"Batch summary {custom_id} failed: {error}")
+                summary = {
+                    "timestamp": datetime.now().isoformat(),
+                    "summary": f"Error generating summary: {error}",
+                    "error": error,
+                }
+            summaries.append(summary)
+
+        logger.info(f"Summary batch {batch.id} finished ({len(texts)}/{len(transcripts)} succeeded)")
+        return summaries
+
+    async def _fits_input_budget(self, transcript: str, context: Optional[str] = None) -> bool:
+        """
+        Check that a single-shot summary prompt fits Config.MAX_INPUT_TOKENS
 
-Keep the summary concise, factual, and well-organized. Focus on actionable information and key takeaways."""
+        Prompts with fewer UTF-8 bytes than the budget always fit (a token covers at
+        least one byte), so only unusually long prompts cost a count_tokens call.
+        Counts are cached by prompt digest.
 
-        if context:
-            prompt = f"""{base_prompt}
+        Args:
+            transcript: Transcript to summarize
+            context: Optional context from previous summaries
+
+        Returns:
+            bool: True if the prompt leaves room for the 1500-token response
+        """
+        budget = Config.MAX_INPUT_TOKENS - 1500
+        blocks = self._build_summary_prompt(transcript, context)
+        data = "".join(block["text"] for block in blocks).encode()
+        if len(data) <= budget:
+            return True
+
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        tokens = self._token_counts.get(key)
+        if tokens is None:
+            result = await self.client.messages.count_tokens(
+                model=Config.CLAUDE_MODEL, messages=[{"role": "user", "content": blocks}]
+            )
+            tokens = self._token_counts[key] = result.input_tokens
+            if len(self._token_counts) > 4096:
+                self._token_counts.popitem(last=False)
+        else:
+            self._token_counts.move_to_end(key)
+
+        return tokens <= budget
+
+    @staticmethod
+    def _split_windows(transcript: str, w: int = 1024, s: int = 128) -> List[str]:
+        """
+        Split a transcript into overlapping windows of words
+
+        Args:
+            transcript: The transcript text
+            w: Words per window
+            s: Words shared between consecutive windows
+
+        Returns:
+            List of window texts (a single window if the transcript fits)
+        """
+        words = transcript.split()
+        if len(words) <= w:
+            return [transcript]
+
+        step = max(w - s, 1)
+        return [" ".join(words[start : start + w]) for start in range(0, len(words) - s, step)]
+
+    async def _summarize_window(self, window: str) -> str:
+        """
+        Condense one transcript window into short notes for the reduce step
+
+        Windows are cut from the start of the transcript with a fixed step, so every
+        window but the last is unchanged as the meeting grows. Notes are cached by
+        window digest, and each summary only maps the new or changed tail windows.
+
+        Args:
+            window: Transcript window text
+
+        Returns:
+            Bullet-point notes for the window
+        """
+        key = hashlib.blake2b(window.encode(), digest_size=16).digest()
+        notes = self._window_notes.get(key)
+        if notes is not None:
+            self._window_notes.move_to_end(key)
+            return notes
+
+        async with self._window_semaphore:
+            response = await self._create(
+                model=Config.CLAUDE_MODEL,
+                max_tokens=400,
+                temperature=0.3,
+                messages=[{"role": "user", "content": f"{self.WINDOW_PROMPT}\n\nTRANSCRIPT EXCERPT:\n{window}"}],
+            )
+
+        notes = self._window_notes[key] = response.content[0].text
+        if len(self._window_notes) > 256:
+            self._window_notes.popitem(last=False)
+        return notes
 
-CONTEXT FROM PREVIOUS SUMMARIES:
+    async def _maybe_condense(self, tail: int = 2, batch: int = 3):
+        """
+        Fold summaries that have left the recent window into condensed_context
+
+        Runs once at least `batch` summaries have moved out of the last `tail`, so one
+        condense call covers several summaries. Until then get_context_for_next_summary
+        includes them verbatim, so every summary stays in the prompt context.
+
+        Args:
+            tail: Recent summaries that get_context_for_next_summary includes verbatim
+            batch: Summaries outside the tail to accumulate before condensing
+        """
+        end = len(self.summaries) - tail
+        pending = self.summaries[self._condensed_upto : end]
+        if len(pending) < batch:
+            return
+
+        parts = [self.CONDENSE_PROMPT]
+        if self.condensed_context:
+            parts.append(f"EARLIER IN THE MEETING:\n{self.condensed_context}")
+        parts.append("LATER SUMMARIES:\n" + "\n\n".join(self._overview(summary) for summary in pending))
+
+        try:
+            response = await self._create(
+                model=Config.CLAUDE_MODEL,
+                max_tokens=400,
+                temperature=0.3,
+                messages=[{"role": "user", "content": "\n\n".join(parts)}],
+            )
+            self.condensed_context = response.content[0].text
+            self._condensed_upto = end
+            logger.info(f"Condensed summaries 1-{end} into running context")
+        except Exception as e:
+            logger.warning(f"Could not condense summary context: {e}")
+
+    @staticmethod
+    def _overview(summary: Dict[str, Any]) -> str:
+        """Get a summary's overview, falling back to the start of its raw text"""
+        if "parsed" in summary and summary["parsed"].get("overview"):
+            return summary["parsed"]["overview"]
+        # Fallback to first 200 chars of raw summary
+        return summary.get("summary", "")[:200] + "..."
+
+    def _build_summary_prompt(self, transcript: str, context: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Build the prompt for Claude as message content blocks
+
+        The instructions come first as their own block, marked for prompt caching,
+        so repeated calls reuse the cached prefix instead of re-processing it.
+
+        Returns:
+            Content blocks for a user message
+        """
+        if context:
+            body = f"""CONTEXT FROM PREVIOUS SUMMARIES:
 {context}
 
 CURRENT TRANSCRIPT SEGMENT:
 {transcript}"""
         else:
-            prompt = f"""{base_prompt}
-
-TRANSCRIPT:
+            body = f"""TRANSCRIPT:
 {transcript}"""
 
-        return prompt
+        return [
+            {"type": "text", "text": self.SUMMARY_PROMPT, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": body},
+        ]
 
     def _parse_summary(self, summary_text: str) -> Dict[str, List[str]]:
         """
@@ -134,51 +572,18 @@ TRANSCRIPT:
         Returns:
             Dictionary with categorized content
         """
-        parsed = {
-            "key_points": [],
-            "decisions": [],
-            "action_items": [],
-            "questions": [],
-            "overview": "",
-        }
+        if _compiled_parse_summary is not None:
+            # Cython build of summary_parser.parse_summary (src/_parse.pyx), when compiled
+            try:
+                return _compiled_parse_summary(summary_text)
+            except Exception as e:
+                logger.warning(f"Error parsing summary structure: {e}")
 
         try:
-            lines = summary_text.split("\n")
-            current_section = None
-
-            for line in lines:
-                line = line.strip()
-
-                if not line:
-                    continue
-
-                # Detect sections
-                if "key discussion" in line.lower() or "discussion points" in line.lower():
-                    current_section = "key_points"
-                elif "decision" in line.lower():
-                    current_section = "decisions"
-                elif "action item" in line.lower():
-                    current_section = "action_items"
-                elif "question" in line.lower() or "concern" in line.lower():
-                    current_section = "questions"
-                elif "overall summary" in line.lower():
-                    current_section = "overview"
-                elif line.startswith("- ") or line.startswith("* "):
-                    # Bullet point - add to current section
-                    content = line[2:].strip()
-                    if current_section and current_section != "overview":
-                        parsed[current_section].append(content)
-                elif current_section == "overview" and not line.startswith("#"):
-                    # Add to overview
-                    if parsed["overview"]:
-                        parsed["overview"] += " " + line
-                    else:
-                        parsed["overview"] = line
-
+            return parse_summary(summary_text)
         except Exception as e:
             logger.warning(f"Error parsing summary structure: {e}")
-
-        return parsed
+            return {"key_points": [], "decisions": [], "action_items": [], "questions": [], "overview": ""}
 
     def get_all_summaries(self) -> List[Dict[str, Any]]:
         """Get all generated summaries"""
@@ -189,7 +594,8 @@ TRANSCRIPT:
         Get context from previous summaries
 
         Args:
-            num_previous: Number of previous summaries to include
+            num_previous: Number of previous summaries to include verbatim
+                (more while older ones are still waiting to be condensed)
 
         Returns:
             Formatted context string
@@ -197,17 +603,15 @@ TRANSCRIPT:
         if not self.summaries:
             return ""
 
-        recent = self.summaries[-num_previous:]
+        # Summaries not yet folded into condensed_context are included verbatim as well
+        recent = self.summaries[min(self._condensed_upto, max(len(self.summaries) - num_previous, 0)) :]
         context_parts = []
 
+        if self.condensed_context:
+            context_parts += ["Earlier in the meeting:", self.condensed_context]
+
         for i, summary in enumerate(recent, 1):
-            context_parts.append(f"Summary {i}:")
-            if "parsed" in summary and summary["parsed"].get("overview"):
-                context_parts.append(summary["parsed"]["overview"])
-            else:
-                # Fallback to first 200 chars of raw summary
-                summary_text = summary.get("summary", "")
-                context_parts.append(summary_text[:200] + "...")
+            context_parts += [f"Summary {i}:", self._overview(summary)]
 
         return "\n\n".join(context_parts)
 
@@ -222,60 +626,57 @@ TRANSCRIPT:
             Formatted summary export
         """
         if format == "json":
-            import json
-
+            if orjson:
+                return orjson.dumps(self.summaries, option=orjson.OPT_INDENT_2).decode()
             return json.dumps(self.summaries, indent=2)
 
         elif format == "markdown":
-            output = "# Meeting Summaries\n\n"
+            parts = ["# Meeting Summaries\n\n"]
 
             for i, summary in enumerate(self.summaries, 1):
                 timestamp = summary.get("timestamp", "Unknown")
-                output += f"## Summary {i} - {timestamp}\n\n"
+                parts.append(f"## Summary {i} - {timestamp}\n\n")
 
                 if "parsed" in summary:
-                    parsed = summary["parsed"]
-
-                    if parsed.get("overview"):
-                        output += f"**Overview:** {parsed['overview']}\n\n"
-
-                    if parsed.get("key_points"):
-                        output += "**Key Points:**\n"
-                        for point in parsed["key_points"]:
-                            output += f"- {point}\n"
-                        output += "\n"
-
-                    if parsed.get("decisions"):
-                        output += "**Decisions:**\n"
-                        for decision in parsed["decisions"]:
-                            output += f"- {decision}\n"
-                        output += "\n"
-
-                    if parsed.get("action_items"):
-                        output += "**Action Items:**\n"
-                        for item in parsed["action_items"]:
-                            output += f"- {item}\n"
-                        output += "\n"
-
-                    if parsed.get("questions"):
-                        output += "**Questions/Concerns:**\n"
-                        for question in parsed["questions"]:
-                            output += f"- {question}\n"
-                        output += "\n"
+                    for _emoji, label, is_list, value in iter_sections(summary["parsed"]):
+                        if is_list:
+                            parts.append(f"**{label}:**\n")
+                            parts.extend(f"- {item}\n" for item in value)
+                            parts.append("\n")
+                        else:
+                            parts.append(f"**{label}:** {value}\n\n")
                 else:
-                    output += summary.get("summary", "") + "\n\n"
+                    parts += [summary.get("summary", ""), "\n\n"]
 
-                output += "---\n\n"
+                parts.append("---\n\n")
 
-            return output
+            return "".join(parts)
 
         else:  # text format
-            output = "MEETING SUMMARIES\n" + "=" * 50 + "\n\n"
+            parts = ["MEETING SUMMARIES\n", "=" * 50, "\n\n"]
 
             for i, summary in enumerate(self.summaries, 1):
                 timestamp = summary.get("timestamp", "Unknown")
-                output += f"Summary {i} ({timestamp}):\n"
-                output += "-" * 50 + "\n"
-                output += summary.get("summary", "") + "\n\n"
+                parts += [f"Summary {i} ({timestamp}):\n", "-" * 50, "\n", summary.get("summary", ""), "\n\n"]
+
+            return "".join(parts)
+
+    def export_summaries_to_file(self, path: Union[str, Path]):
+        """
+        Write all summaries to a JSON file one summary at a time
 
-            return output
+        Unlike export_summaries(format="json"), the full document is never held in
+        memory, which matters once many summaries with raw transcripts pile up.
+
+        Args:
+            path: Destination file
+        """
+        with open(path, "wb") as f:
+            f.write(b"[")
+            for i, summary in enumerate(self.summaries):
+                f.write(b",\n" if i else b"\n")
+                if orjson:
+                    f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+                else:
+                    f.write(json.dumps(summary, indent=2).encode())
+            f.write(b"\n]\n")
@@ -0,0 +1,172 @@
+"""
+Parsing of Claude's structured meeting summaries into their sections
+"""
+from typing import Any, Callable, Dict, List, Optional
+
+
+def _section_of(line: str) -> Optional[str]:
+    """
+    Get the section a heading line starts
+
+    Keywords are tested in priority order, so "Action items from the decision"
+    starts the decisions section. Plain substring tests beat a regex search here.
+
+    Args:
+        line: Stripped, non-bullet line
+
+    Returns:
+        Parsed field name, or None if the line is not a heading
+    """
+    lower = line.lower()
+    if "key discussion" in lower or "discussion points" in lower:
+        return "key_points"
+    if "decision" in lower:
+        return "decisions"
+    if "action item" in lower:
+        return "action_items"
+    if "question" in lower or "concern" in lower:
+        return "questions"
+    if "overall summary" in lower:
+        return "overview"
+    return None
+
+
+class IncrementalSummaryParser:
+    """
+    Parse a summary response into its sections as it streams in
+
+    Text is buffered until a newline, so each complete line is parsed exactly once
+    while later output is still arriving. For a complete response use parse_summary(),
+    a tighter loop over the same rules (tests check the two agree).
+    """
+
+    __slots__ = ("parsed", "_overview", "_buffer", "_section", "_on_section")
+
+    def __init__(self, on_section: Optional[Callable[[str, str], None]] = None):
+        """
+        Args:
+            on_section: Called with (section, item) for each bullet or overview line parsed
+        """
+        self.parsed: Dict[str, Any] = {
+            "key_points": [],
+            "decisions": [],
+            "action_items": [],
+            "questions": [],
+            "overview": "",
+        }
+        self._overview: List[str] = []
+        self._buffer = ""
+        self._section: Optional[str] = None
+        self._on_section = on_section
+
+    def feed(self, chunk: str):
+        """
+        Consume a streamed text chunk, parsing any lines it completes
+
+        Args:
+            chunk: Text delta from the response stream
+        """
+        self._buffer += chunk
+        if "\n" not in chunk:
+            return
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self._parse_line(line)
+
+    def finalize(self) -> Dict[str, Any]:
+        """
+        Parse the trailing unterminated line, if any
+
+        Returns:
+            Dictionary with categorized content
+        """
+        if self._buffer:
+            self._parse_line(self._buffer)
+            self._buffer = ""
+        self.parsed["overview"] = " ".join(self._overview)
+        return self.parsed
+
+    def _parse_line(self, line: str):
+        """Apply the section/bullet rules to one complete line"""
+        line = line.strip()
+
+        if not line:
+            return
+
+        if line.startswith(("- ", "* ")):
+            # Bullet point - add to current section (overview is prose, bullets there are ignored)
+            if self._section and self._section != "overview":
+                self._emit(self._section, line[2:].strip())
+            return
+
+        # Detect sections
+        section = _section_of(line)
+        if section:
+            self._section = section
+        elif self._section == "overview" and not line.startswith("#"):
+            self._emit("overview", line)
+
+    def _emit(self, section: str, item: str):
+        """Record a parsed item and report it to on_section"""
+        if section == "overview":
+            self._overview.append(item)
+        else:
+            self.parsed[section].append(item)
+        if self._on_section:
+            self._on_section(section, item)
+
+
+def parse_summary(summary_text: str) -> Dict[str, Any]:
+    """
+    Parse structured summary from Claude's response
+
+    Args:
+        summary_text: Complete response text
+
+    Returns:
+        Dictionary with categorized content
+    """
+    parsed = {
+        "key_points": [],
+        "decisions": [],
+        "action_items": [],
+        "questions": [],
+        "overview": "",
+    }
+
+    # Bound methods hoisted out of the loop: one local lookup per line
+    overview = []
+    appenders = {
+        "key_points": parsed["key_points"].append,
+        "decisions": parsed["decisions"].append,
+        "action_items": parsed["action_items"].append,
+        "questions": parsed["questions"].append,
+        "overview": None,  # Overview is prose, bullets there are ignored
+    }
+    section_of = _section_of
+    current_section = None
+    append = None
+
+    for line in summary_text.split("\n"):
+        line = line.strip()
+
+        if not line:
+            continue
+
+        if line.startswith(("- ", "* ")):
+            # Bullet point - add to current section
+            if append:
+                append(line[2:].strip())
+            continue
+
+        # Detect sections
+        section = section_of(line)
+        if section:
+            current_section = section
+            append = appenders[section]
+        elif current_section == "overview" and not line.startswith("#"):
+            # Add to overview
+            overview.append(line)
+
+    parsed["overview"] = " ".join(overview)
+    return parsed
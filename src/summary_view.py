@@ -0,0 +1,29 @@
+"""
+Shared rendering helpers for parsed meeting summaries
+"""
+from typing import Any, Dict, Iterator, Tuple
+
+# (parsed key, emoji, label, is_list) in display order
+SECTIONS = (
+    ("overview", "📌", "Overview", False),
+    ("key_points", "🔑", "Key Points", True),
+    ("decisions", "✅", "Decisions", True),
+    ("action_items", "📋", "Action Items", True),
+    ("questions", "❓", "Questions/Concerns", True),
+)
+
+
+def iter_sections(parsed: Dict[str, Any]) -> Iterator[Tuple[str, str, bool, Any]]:
+    """
+    Iterate over the non-empty sections of a parsed summary
+
+    Args:
+        parsed: The "parsed" dict produced by MeetingSummarizer
+
+    Yields:
+        (emoji, label, is_list, value) for each section that has content
+    """
+    for key, emoji, label, is_list in SECTIONS:
+        value = parsed.get(key)
+        if value:
+            yield emoji, label, is_list, value
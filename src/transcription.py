@@ -2,9 +2,14 @@
 Real-time transcription using AssemblyAI or Deepgram
 """
 import asyncio
+import functools
+import inspect
 import logging
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Callable, Dict, Any
+from collections import deque
+from typing import Optional, Callable, Deque, Dict, Any, FrozenSet, List, Tuple, Union
 import queue
 import threading
 import json
@@ -23,6 +28,32 @@ from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Stripped before comparing transcripts from different services
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+# Raw 16-bit PCM: bytes, or anything exposing the buffer protocol (memoryview, numpy array)
+AudioBuffer = Union[bytes, bytearray, memoryview, Any]
+
+
+def _as_buffer(audio_data: AudioBuffer) -> Union[bytes, memoryview]:
+    """
+    View audio data as a flat byte buffer without copying where possible
+
+    Args:
+        audio_data: PCM audio as bytes or any buffer-protocol object
+
+    Returns:
+        bytes unchanged, otherwise a byte-format memoryview over the same memory
+        (a copy only for non-contiguous arrays)
+    """
+    if isinstance(audio_data, bytes):
+        return audio_data
+    try:
+        view = memoryview(audio_data)
+        return view if view.format == "B" and view.ndim == 1 else view.cast("B")
+    except TypeError:
+        return audio_data.tobytes()
+
 
 class TranscriptionService(ABC):
     """Abstract base class for transcription services"""
@@ -37,8 +68,13 @@ class TranscriptionService(ABC):
         pass
 
     @abstractmethod
-    async def send_audio(self, audio_data: bytes):
-        """Send audio data for transcription"""
+    async def send_audio(self, audio_data: AudioBuffer):
+        """
+        Send audio data for transcription
+
+        Buffers may be passed through without copying, so the caller must not
+        modify audio_data until this coroutine has returned.
+        """
         pass
 
     @abstractmethod
@@ -46,10 +82,17 @@ class TranscriptionService(ABC):
         """Stop the transcription service"""
         pass
 
+    async def keep_alive(self):
+        """Keep an idle session open (called while no audio is being sent)"""
+        pass
+
 
 class AssemblyAITranscriber(TranscriptionService):
     """Real-time transcription using AssemblyAI"""
 
+    # 100 ms of 16-bit mono silence, streamed as a keep-alive
+    _SILENCE = bytes(Config.SAMPLE_RATE // 10 * 2)
+
     def __init__(self, on_transcript: Optional[Callable] = None):
         super().__init__(on_transcript)
 
@@ -71,7 +114,8 @@ class AssemblyAITranscriber(TranscriptionService):
                 logger.info(f"AssemblyAI session opened: {session_opened.session_id}")
 
             def on_data(transcript: aai.RealtimeTranscript):
-                if not transcript.text:
+                # Build the result dict only if someone will receive it
+                if not transcript.text or not self.on_transcript:
                     return
 
                 if isinstance(transcript, aai.RealtimeFinalTranscript):
@@ -82,8 +126,7 @@ class AssemblyAITranscriber(TranscriptionService):
                         "confidence": getattr(transcript, "confidence", None),
                     }
 
-                    if self.on_transcript:
-                        self.on_transcript(result)
+                    self.on_transcript(result)
 
             def on_error(error: aai.RealtimeError):
                 logger.error(f"AssemblyAI error: {error}")
@@ -109,23 +152,28 @@ class AssemblyAITranscriber(TranscriptionService):
             logger.error(f"Error starting AssemblyAI: {e}")
             raise
 
-    async def send_audio(self, audio_data: bytes):
+    async def send_audio(self, audio_data: AudioBuffer):
         """Send audio data to AssemblyAI"""
         if not self.is_active or not self.transcriber:
             return
 
         try:
-            # AssemblyAI expects raw PCM audio bytes
-            if hasattr(audio_data, "tobytes"):
-                audio_bytes = audio_data.tobytes()
-            else:
-                audio_bytes = audio_data
-
-            self.transcriber.stream(audio_bytes)
+            # AssemblyAI expects raw PCM audio bytes. The SDK queues them for its own
+            # sender thread, so anything but immutable bytes must be copied once here.
+            buffer = _as_buffer(audio_data)
+            self.transcriber.stream(buffer if isinstance(buffer, bytes) else bytes(buffer))
 
         except Exception as e:
             logger.error(f"Error sending audio to AssemblyAI: {e}")
 
+    async def keep_alive(self):
+        """Send a short burst of silence so the session doesn't time out while idle"""
+        if self.is_active and self.transcriber:
+            try:
+                self.transcriber.stream(self._SILENCE)
+            except Exception as e:
+                logger.debug(f"AssemblyAI keep-alive failed: {e}")
+
     async def stop(self):
         """Stop AssemblyAI transcription"""
         if not self.is_active:
@@ -171,7 +219,7 @@ class DeepgramTranscriber(TranscriptionService):
                 try:
                     sentence = result.channel.alternatives[0].transcript
 
-                    if len(sentence) == 0:
+                    if len(sentence) == 0 or not self.on_transcript:
                         return
 
                     is_final = result.is_final
@@ -182,8 +230,7 @@ class DeepgramTranscriber(TranscriptionService):
                         "confidence": result.channel.alternatives[0].confidence,
                     }
 
-                    if self.on_transcript:
-                        self.on_transcript(transcript_result)
+                    self.on_transcript(transcript_result)
 
                 except Exception as e:
                     logger.error(f"Error processing Deepgram message: {e}")
@@ -218,23 +265,26 @@ class DeepgramTranscriber(TranscriptionService):
             logger.error(f"Error starting Deepgram: {e}")
             raise
 
-    async def send_audio(self, audio_data: bytes):
+    async def send_audio(self, audio_data: AudioBuffer):
         """Send audio data to Deepgram"""
         if not self.is_active or not self.connection:
             return
 
         try:
-            # Convert numpy array to bytes if needed
-            if hasattr(audio_data, "tobytes"):
-                audio_bytes = audio_data.tobytes()
-            else:
-                audio_bytes = audio_data
-
-            await self.connection.send(audio_bytes)
+            # The websocket send completes before returning, so a zero-copy view is safe
+            await self.connection.send(_as_buffer(audio_data))
 
         except Exception as e:
             logger.error(f"Error sending audio to Deepgram: {e}")
 
+    async def keep_alive(self):
+        """Send Deepgram's KeepAlive message so the idle connection stays open"""
+        if self.is_active and self.connection:
+            try:
+                await self.connection.keep_alive()
+            except Exception as e:
+                logger.debug(f"Deepgram keep-alive failed: {e}")
+
     async def stop(self):
         """Stop Deepgram transcription"""
         if not self.is_active:
@@ -256,11 +306,46 @@ class DeepgramTranscriber(TranscriptionService):
 class TranscriptionManager:
     """Manages transcription with the configured service"""
 
+    # Queued results beyond which interim (non-final) results are dropped
+    MAX_PENDING = 256
+
+    # "race" mode: a final is treated as the same speech and dropped when, against the finals
+    # the other service emitted within RACE_WINDOW_SECONDS, this share of the smaller word set
+    # is contained in one of them, or this share of its own words is covered by all of them
+    # together. The services split utterances differently, so overlap is measured as
+    # containment rather than Jaccard similarity. Below RACE_MIN_WORDS only identical word
+    # sets count, so a short reply ("yes") is not swallowed by a longer sentence.
+    RACE_WINDOW_SECONDS = 10.0
+    RACE_SIMILARITY = 0.8
+    RACE_MIN_WORDS = 3
+
+    # Ping idle sessions this often; Deepgram closes a connection after ~10 s without data
+    KEEPALIVE_SECONDS = 5.0
+
     def __init__(self, on_transcript: Optional[Callable] = None):
+        """
+        Args:
+            on_transcript: Called on the event loop with each transcript result
+                (may be a plain function or a coroutine function)
+        """
         self.on_transcript = on_transcript
         self.service: Optional[TranscriptionService] = None
+        self.services: List[TranscriptionService] = []  # More than one in "race" mode
         self.transcript_buffer = []
 
+        # Recently emitted results in "race" mode: (monotonic time, source, is_final, text, word set)
+        self._recent: Deque[Tuple[float, str, bool, str, FrozenSet[str]]] = deque()
+
+        # Results handed from the SDK callback threads to the event loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer_task: Optional[asyncio.Task] = None
+        self._shedding = False  # True while interim results are being dropped
+
+        # Keeps the sessions open between initialize() and the first audio (e.g. while joining)
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._last_audio = 0.0  # time.monotonic() of the last transcribe_audio call
+
     async def initialize(self):
         """Initialize the transcription service"""
         service_name = Config.TRANSCRIPTION_SERVICE.lower()
@@ -268,32 +353,125 @@ class TranscriptionManager:
         logger.info(f"Initializing transcription service: {service_name}")
 
         if service_name == "assemblyai":
-            self.service = AssemblyAITranscriber(on_transcript=self._handle_transcript)
+            self.services = [AssemblyAITranscriber(on_transcript=self._handle_transcript)]
         elif service_name == "deepgram":
-            self.service = DeepgramTranscriber(on_transcript=self._handle_transcript)
+            self.services = [DeepgramTranscriber(on_transcript=self._handle_transcript)]
+        elif service_name == "race":
+            # Run both services on the same audio and keep whichever result arrives first
+            self.services = [
+                AssemblyAITranscriber(on_transcript=functools.partial(self._handle_race, "assemblyai")),
+                DeepgramTranscriber(on_transcript=functools.partial(self._handle_race, "deepgram")),
+            ]
         else:
             raise ValueError(f"Unknown transcription service: {service_name}")
+        self.service = self.services[0]
+
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._consumer_task = asyncio.create_task(self._consumer())
 
-        await self.service.start()
+        await asyncio.gather(*(service.start() for service in self.services))
+        self._keepalive_task = asyncio.create_task(self._keepalive())
+
+    async def _keepalive(self):
+        """Ping the services whenever no audio has been sent for KEEPALIVE_SECONDS"""
+        while True:
+            await asyncio.sleep(self.KEEPALIVE_SECONDS)
+            if time.monotonic() - self._last_audio >= self.KEEPALIVE_SECONDS:
+                await asyncio.gather(*(service.keep_alive() for service in self.services))
 
     def _handle_transcript(self, result: Dict[str, Any]):
-        """Handle transcript from service"""
-        # Add to buffer
-        self.transcript_buffer.append(result)
+        """Handle transcript from service (may run on an SDK thread)"""
+        self._loop.call_soon_threadsafe(self._enqueue, result)
+
+    def _handle_race(self, source: str, result: Dict[str, Any]):
+        """Handle transcript from one of the racing services (may run on an SDK thread)"""
+        self._loop.call_soon_threadsafe(self._dedupe, source, result)
+
+    def _dedupe(self, source: str, result: Dict[str, Any]):
+        """Queue a racing service's result unless the other service already delivered it"""
+        now = time.monotonic()
+        while self._recent and now - self._recent[0][0] > self.RACE_WINDOW_SECONDS:
+            self._recent.popleft()
+
+        is_final = bool(result.get("is_final"))
+        text = result["text"]
+        words = frozenset(_PUNCTUATION_RE.sub("", text.lower()).split())
+
+        covered = set()
+        for _, seen_source, seen_final, seen_text, seen_words in self._recent:
+            if seen_final != is_final:
+                continue
+            if seen_text == text:
+                return
+            if is_final and seen_source != source and words and seen_words:
+                if words == seen_words:
+                    return
+                smaller = min(len(words), len(seen_words))
+                if smaller >= self.RACE_MIN_WORDS and len(words & seen_words) / smaller >= self.RACE_SIMILARITY:
+                    return
+                covered |= words & seen_words
+
+        if len(words) >= self.RACE_MIN_WORDS and len(covered) / len(words) >= self.RACE_SIMILARITY:
+            return
 
-        # Call user callback
-        if self.on_transcript:
-            self.on_transcript(result)
+        self._recent.append((now, source, is_final, text, words))
+        self._enqueue({**result, "source": source})
+
+    def _enqueue(self, result: Optional[Dict[str, Any]]):
+        """Queue a result on the event loop (None stops the consumer)"""
+        if result is not None and not result.get("is_final") and self._queue.qsize() >= self.MAX_PENDING:
+            # Consumer is behind: shed interim results, which the next final supersedes anyway.
+            # Final text is never dropped.
+            if not self._shedding:
+                logger.warning("Transcript consumer is behind, dropping interim results")
+                self._shedding = True
+            return
+        self._queue.put_nowait(result)
+
+    async def _consumer(self):
+        """Record queued results and pass them to on_transcript, off the SDK threads"""
+        while True:
+            result = await self._queue.get()
+            if result is None:
+                break
+            if self._shedding and self._queue.empty():
+                self._shedding = False
+
+            # Add to buffer
+            self.transcript_buffer.append(result)
+
+            # Call user callback
+            if self.on_transcript:
+                try:
+                    ret = self.on_transcript(result)
+                    if inspect.isawaitable(ret):
+                        await ret
+                except Exception as e:
+                    logger.error(f"Error in transcript callback: {e}")
 
-    async def transcribe_audio(self, audio_data: bytes):
+    async def transcribe_audio(self, audio_data: AudioBuffer):
         """Send audio for transcription"""
-        if self.service:
+        self._last_audio = time.monotonic()
+        if len(self.services) == 1:
             await self.service.send_audio(audio_data)
+        elif self.services:
+            await asyncio.gather(*(service.send_audio(audio_data) for service in self.services))
 
     async def stop(self):
-        """Stop transcription"""
-        if self.service:
-            await self.service.stop()
+        """Stop transcription, delivering any results still queued"""
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+
+        if self.services:
+            await asyncio.gather(*(service.stop() for service in self.services))
+
+        if self._consumer_task:
+            # Queued behind any results the SDK threads have already scheduled
+            self._loop.call_soon(self._enqueue, None)
+            await self._consumer_task
+            self._consumer_task = None
 
     def get_full_transcript(self, final_only: bool = True) -> str:
         """
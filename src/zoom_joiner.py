@@ -3,8 +3,9 @@ Zoom meeting automation using Playwright
 """
 import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
 from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from .config import Config
 
 logger = logging.getLogger(__name__)
@@ -13,8 +14,22 @@ logger = logging.getLogger(__name__)
 class ZoomJoiner:
     """Handles joining Zoom meetings via browser automation"""
 
-    def __init__(self, display_name: Optional[str] = None):
+    JOIN_BROWSER_SELECTOR = "a[class*='join']"
+    NAME_SELECTOR = "input[type='text']"
+    PASSWORD_SELECTOR = "input[type='password']"
+    # Common meeting UI elements
+    IN_MEETING_SELECTORS = [
+        "button[aria-label*='Mute']",
+        "button[aria-label*='Stop Video']",
+        "button[aria-label*='Leave']",
+        ".meeting-client-inner",
+    ]
+
+    __slots__ = ("display_name", "headless", "browser", "page", "playwright", "_is_in_meeting")
+
+    def __init__(self, display_name: Optional[str] = None, headless: Optional[bool] = None):
         self.display_name = display_name or Config.ZOOM_DISPLAY_NAME
+        self.headless = Config.ZOOM_HEADLESS if headless is None else headless
         self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
         self.playwright = None
@@ -25,21 +40,27 @@ class ZoomJoiner:
         logger.info("Initializing browser...")
         self.playwright = await async_playwright().start()
 
-        # Launch browser with audio capture capabilities
+        # Launch browser with audio capture capabilities. Only the meeting audio matters,
+        # so skip GPU/compositor work; audio is not muted (it is captured via loopback)
         self.browser = await self.playwright.chromium.launch(
-            headless=False,  # Run in headed mode to see the meeting
+            headless=self.headless,
             args=[
                 "--use-fake-ui-for-media-stream",  # Auto-grant media permissions
                 "--use-fake-device-for-media-stream",  # Use fake audio device
                 "--disable-blink-features=AutomationControlled",
                 "--no-sandbox",
+                "--disable-gpu",
+                "--disable-software-rasterizer",
+                "--disable-dev-shm-usage",
+                "--disable-features=MediaFoundationVideoCapture,WebRtcHideLocalIpsWithMdns",
+                "--autoplay-policy=no-user-gesture-required",  # Play meeting audio without a click
             ],
         )
 
-        # Create context with audio permissions
+        # Create context with audio permissions; nobody watches the page, so keep it small
         context = await self.browser.new_context(
             permissions=["microphone", "camera"],
-            viewport={"width": 1280, "height": 720},
+            viewport={"width": 640, "height": 360},
         )
 
         self.page = await context.new_page()
@@ -61,53 +82,49 @@ class ZoomJoiner:
 
         try:
             logger.info(f"Navigating to meeting: {meeting_url}")
-            await self.page.goto(meeting_url, wait_until="networkidle")
-
-            # Wait a bit for the page to load
-            await asyncio.sleep(2)
+            await self.page.goto(meeting_url, wait_until="domcontentloaded")
 
             # Click "Join from Your Browser" link if present
             try:
-                join_browser_link = self.page.locator("a[class*='join']").first
-                if await join_browser_link.is_visible(timeout=5000):
+                if await self._wait_any([self.JOIN_BROWSER_SELECTOR], timeout=5):
                     logger.info("Clicking 'Join from Browser'...")
-                    await join_browser_link.click()
-                    await asyncio.sleep(2)
+                    await self.page.locator(self.JOIN_BROWSER_SELECTOR).first.click()
+                    # Continue as soon as the next screen (name or password prompt) renders
+                    await self._wait_any([self.NAME_SELECTOR, self.PASSWORD_SELECTOR], timeout=5)
             except Exception as e:
                 logger.debug(f"Join from browser link not found or not needed: {e}")
 
             # Enter display name
             try:
-                name_input = self.page.locator("input[type='text']").first
-                if await name_input.is_visible(timeout=5000):
+                if await self._wait_any([self.NAME_SELECTOR], timeout=5):
                     logger.info(f"Entering display name: {self.display_name}")
-                    await name_input.fill(self.display_name)
+                    await self.page.locator(self.NAME_SELECTOR).first.fill(self.display_name)
             except Exception as e:
                 logger.debug(f"Name input not found: {e}")
 
             # Handle password if required
             if password:
                 try:
-                    password_input = self.page.locator("input[type='password']").first
-                    if await password_input.is_visible(timeout=5000):
+                    if await self._wait_any([self.PASSWORD_SELECTOR], timeout=5):
                         logger.info("Entering meeting password...")
-                        await password_input.fill(password)
+                        await self.page.locator(self.PASSWORD_SELECTOR).first.fill(password)
                 except Exception as e:
                     logger.debug(f"Password input not found: {e}")
 
             # Click join button
             try:
                 join_button = self.page.locator("button").filter(has_text="Join")
-                if await join_button.is_visible(timeout=5000):
-                    logger.info("Clicking Join button...")
-                    await join_button.click()
-                    await asyncio.sleep(3)
+                await join_button.first.wait_for(state="visible", timeout=5000)
+                logger.info("Clicking Join button...")
+                await join_button.first.click()
+
+                # Wait for whichever comes next: the meeting UI, or a password prompt
+                next_screen = await self._wait_any([*self.IN_MEETING_SELECTORS, self.PASSWORD_SELECTOR], timeout=8)
+                if next_screen == self.PASSWORD_SELECTOR:
+                    logger.warning("Meeting asked for a password after joining")
             except Exception as e:
                 logger.warning(f"Join button not found: {e}")
 
-            # Check if we're in the meeting
-            await asyncio.sleep(5)
-
             # Look for indicators that we're in a meeting
             in_meeting = await self._check_in_meeting()
 
@@ -126,27 +143,46 @@ class ZoomJoiner:
     async def _check_in_meeting(self) -> bool:
         """Check if we're currently in a meeting"""
         try:
-            # Look for common meeting UI elements
-            indicators = [
-                "button[aria-label*='Mute']",
-                "button[aria-label*='Stop Video']",
-                "button[aria-label*='Leave']",
-                ".meeting-client-inner",
-            ]
-
-            for indicator in indicators:
-                try:
-                    element = self.page.locator(indicator).first
-                    if await element.is_visible(timeout=2000):
-                        return True
-                except:
-                    continue
-
-            return False
+            # Probe all indicators at once: a miss costs one timeout instead of one per selector
+            return await self._wait_any(self.IN_MEETING_SELECTORS, timeout=2) is not None
         except Exception as e:
             logger.debug(f"Error checking meeting status: {e}")
             return False
 
+    async def _wait_any(self, selectors: List[str], timeout: float) -> Optional[str]:
+        """
+        Wait until any of the selectors becomes visible
+
+        Args:
+            selectors: Candidate selectors
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            The first selector to become visible, or None on timeout
+        """
+
+        async def visible(selector: str) -> bool:
+            # Failures count as "not visible" so they never win the race below
+            try:
+                await self.page.locator(selector).first.wait_for(state="visible", timeout=timeout * 1000)
+                return True
+            except Exception:
+                return False
+
+        tasks = {asyncio.create_task(visible(selector)): selector for selector in selectors}
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.result():
+                        return tasks[task]
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def leave_meeting(self):
         """Leave the current meeting"""
         if not self._is_in_meeting:
@@ -157,14 +193,16 @@ class ZoomJoiner:
 
             # Try to find and click the Leave button
             leave_button = self.page.locator("button").filter(has_text="Leave")
-            if await leave_button.is_visible(timeout=5000):
+            if await leave_button.is_visible():
                 await leave_button.click()
-                await asyncio.sleep(1)
 
-                # Confirm leaving if prompted
+                # Confirm leaving if prompted, as soon as the dialog appears
                 confirm_button = self.page.locator("button").filter(has_text="Leave Meeting")
-                if await confirm_button.is_visible(timeout=3000):
-                    await confirm_button.click()
+                try:
+                    await confirm_button.first.wait_for(state="visible", timeout=3000)
+                    await confirm_button.first.click()
+                except PlaywrightTimeoutError:
+                    pass
 
             self._is_in_meeting = False
             logger.info("Left the meeting")
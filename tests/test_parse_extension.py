@@ -0,0 +1,45 @@
+"""
+Tests that the optional Cython parser (src/_parse.pyx) matches the Python one
+"""
+import random
+
+import pytest
+
+from src.summary_parser import parse_summary
+from tests.test_summary_parser import CORPUS
+
+_parse = pytest.importorskip("src._parse", reason="Cython extension not built (cythonize -i src/_parse.pyx)")
+
+FRAGMENTS = [
+    "## Key Discussion Points",
+    "## Discussion points",
+    "## Decisions Made",
+    "## Action Items",
+    "## Important Questions/Concerns",
+    "## Overall Summary",
+    "- a bullet",
+    "*  starred bullet ",
+    "-no space",
+    "plain prose line",
+    "# heading",
+    "   ",
+    "",
+    "The decision was deferred",
+    "Ünïcode – action item?",
+]
+
+
+def _random_summaries(count: int = 200):
+    rng = random.Random(0)
+    for _ in range(count):
+        yield "\n".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 30)))
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_compiled_parser_matches_python_on_corpus(text):
+    assert _parse.parse_summary(text) == parse_summary(text)
+
+
+def test_compiled_parser_matches_python_on_random_summaries():
+    for text in _random_summaries():
+        assert _parse.parse_summary(text) == parse_summary(text), text
@@ -0,0 +1,96 @@
+"""
+Tests for src/summary_parser.py
+"""
+import random
+
+import pytest
+
+from src.summary_parser import IncrementalSummaryParser, parse_summary
+
+SUMMARY = """## Key Discussion Points
+- Budget for Q3 planning
+* Hiring plan for the platform team
+
+## Decisions Made
+- Ship v2 on the 14th
+A stray line outside any bullet
+
+## Action Items
+- Alice: draft the launch doc by Friday
+-  Bob: review pricing
+-not a bullet
+
+## Important Questions/Concerns
+- Is the timeline realistic?
+
+## Overall Summary
+The team agreed on the Q3 budget.
+- bullets in the overview are ignored
+# A heading is not overview text
+Launch prep continues next week."""
+
+CORPUS = [
+    SUMMARY,
+    SUMMARY.replace("\n", "\r\n"),
+    "",
+    "- bullet before any section",
+    "## Decisions\n- trailing item without newline",
+    "Overall summary\nno trailing newline",
+    "## Key Discussion Points\n\n\n- spaced out\n\n## Concerns raised\n* one\n",
+    "## Action items from the decision review\n- follow up\n## Questions about key discussion points\n- why",
+]
+
+
+def test_parse_summary_sections():
+    parsed = parse_summary(SUMMARY)
+
+    assert parsed["key_points"] == ["Budget for Q3 planning", "Hiring plan for the platform team"]
+    assert parsed["decisions"] == ["Ship v2 on the 14th"]
+    assert parsed["action_items"] == ["Alice: draft the launch doc by Friday", "Bob: review pricing"]
+    assert parsed["questions"] == ["Is the timeline realistic?"]
+    assert parsed["overview"] == "The team agreed on the Q3 budget. Launch prep continues next week."
+
+
+@pytest.mark.parametrize(
+    "heading, section",
+    [
+        ("## Action items from the decision review", "decisions"),
+        ("## Questions about key discussion points", "key_points"),
+        ("## Overall summary of open questions", "questions"),
+        ("## Concerns and action items", "action_items"),
+    ],
+)
+def test_section_keyword_priority(heading, section):
+    # Keywords are tested in a fixed priority order, not by position in the line
+    parsed = parse_summary(f"{heading}\n- item")
+
+    assert parsed[section] == ["item"]
+
+
+def test_bullet_with_heading_keyword_stays_in_section():
+    parsed = parse_summary("## Key Discussion Points\n- We hit a decision point on pricing")
+
+    assert parsed["key_points"] == ["We hit a decision point on pricing"]
+    assert parsed["decisions"] == []
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_streamed_parse_matches_whole_text(text):
+    rng = random.Random(0)
+    for _ in range(50):
+        events = []
+        parser = IncrementalSummaryParser(lambda section, item: events.append((section, item)))
+        i = 0
+        while i < len(text):
+            step = rng.randint(1, 16)
+            parser.feed(text[i : i + step])
+            i += step
+
+        parsed = parser.finalize()
+        assert parsed == parse_summary(text)
+
+        # Every parsed item is reported exactly once, in order
+        overview = [item for section, item in events if section == "overview"]
+        assert " ".join(overview) == parsed["overview"]
+        for section in ("key_points", "decisions", "action_items", "questions"):
+            assert [item for s, item in events if s == section] == parsed[section]
@@ -0,0 +1,70 @@
+"""
+Tests for race-mode deduplication in src/transcription.py
+"""
+import asyncio
+
+import pytest
+
+from src.transcription import TranscriptionManager
+
+
+@pytest.fixture
+def manager():
+    manager = TranscriptionManager()
+    manager._queue = asyncio.Queue()
+    return manager
+
+
+def _final(text):
+    return {"text": text, "is_final": True}
+
+
+def _emitted(manager):
+    results = []
+    while not manager._queue.empty():
+        results.append(manager._queue.get_nowait())
+    return [(result["source"], result["text"]) for result in results]
+
+
+def test_split_segments_after_whole_utterance_are_dropped(manager):
+    manager._dedupe("assemblyai", _final("We should move the launch to next Thursday because QA needs more time."))
+    manager._dedupe("deepgram", _final("we should move the launch to next thursday"))
+    manager._dedupe("deepgram", _final("because qa needs more time"))
+
+    assert _emitted(manager) == [
+        ("assemblyai", "We should move the launch to next Thursday because QA needs more time."),
+    ]
+
+
+def test_whole_utterance_after_split_segments_is_dropped(manager):
+    manager._dedupe("deepgram", _final("we should move the launch to next thursday"))
+    manager._dedupe("deepgram", _final("because qa needs more time"))
+    manager._dedupe("assemblyai", _final("We should move the launch to next Thursday, because QA needs more time."))
+
+    assert [source for source, _ in _emitted(manager)] == ["deepgram", "deepgram"]
+
+
+def test_utterance_spanning_two_segments_is_dropped(manager):
+    manager._dedupe("deepgram", _final("the budget is approved for the third quarter"))
+    manager._dedupe("deepgram", _final("and hiring starts in october"))
+    manager._dedupe("assemblyai", _final("Approved for the third quarter, and hiring starts"))
+
+    assert [source for source, _ in _emitted(manager)] == ["deepgram", "deepgram"]
+
+
+def test_short_reply_is_not_swallowed_by_longer_sentence(manager):
+    manager._dedupe("assemblyai", _final("Yes, I think we can ship it on Friday."))
+    manager._dedupe("deepgram", _final("yes i think we can ship it on friday"))
+    manager._dedupe("deepgram", _final("Yes."))
+
+    assert _emitted(manager) == [
+        ("assemblyai", "Yes, I think we can ship it on Friday."),
+        ("deepgram", "Yes."),
+    ]
+
+
+def test_different_speech_from_both_services_is_kept(manager):
+    manager._dedupe("assemblyai", _final("Let's review the pricing page copy."))
+    manager._dedupe("deepgram", _final("who owns the onboarding emails"))
+
+    assert len(_emitted(manager)) == 2